@@ -4,7 +4,8 @@ Defines the Pydantic models (schemas) for validating API request payloads.
 For parsing, validating, and type-casting incoming JSON data. 
 """
 from typing import Annotated, List, Optional
-from decimal import Decimal
+from functools import cached_property
+from operator import attrgetter, countOf
 
 from pydantic import BaseModel, ConfigDict, Field, StringConstraints, model_validator, field_validator, AfterValidator
 
@@ -16,13 +17,24 @@ from src.models.enums import (
     LivingRentalType,
 )
 
+# Compared against in the head-of-household scans below; bound once at import.
+_HEAD_OF_HOUSEHOLD = HouseholdMemberType.HEAD_OF_HOUSEHOLD
+
+
+def has_more_than_two_decimals(v: float) -> bool:
+    """Return True if *v* has more than 2 decimal places.
+
+    A float whose shortest repr has at most 2 decimal places is exactly the
+    nearest float to its 2-decimal rounding, so comparing against `round`
+    matches the ``Decimal(str(v))`` exponent check without building a Decimal.
+    """
+    return round(v, 2) != v
+
 
 def validate_amount_decimals(v: float) -> float:
     """Ensure amount has no more than 2 decimal places."""
     if isinstance(v, (int, float)):
-        # Convert to Decimal to check decimal places
-        decimal_value = Decimal(str(v))
-        if decimal_value.as_tuple().exponent < -2:
+        if has_more_than_two_decimals(v):
             # alternatively, we could just round to 2 decimals. 
             raise ValueError('Amount cannot have more than 2 decimal places')
         
@@ -106,9 +118,7 @@ class Household(BaseModel):
     def validate_cash_on_hand_decimals(cls, v):
         """Ensure cash_on_hand has no more than 2 decimal places."""
         if v is not None and isinstance(v, (int, float)):
-            # Convert to Decimal to check decimal places
-            decimal_value = Decimal(str(v))
-            if decimal_value.as_tuple().exponent < -2:
+            if has_more_than_two_decimals(v):
                 raise ValueError('Cash on hand cannot have more than 2 decimal places')
         return v
 
@@ -126,6 +136,33 @@ class EligibilityRequest(BaseModel):
     household: List[Household] = Field(..., min_length=1, max_length=1)
     person: List[Person] = Field(..., min_length=1, max_length=8)
     
+    @cached_property
+    def head_of_household_index(self) -> Optional[int]:
+        """Index into `person` of the head of household, computed once per request."""
+        return next(
+            (
+                i
+                for i, p in enumerate(self.person)
+                if p.household_member_type == _HEAD_OF_HOUSEHOLD
+            ),
+            None,
+        )
+
+    @cached_property
+    def household_primary(self) -> Household:
+        """The request's single `Household` (`household` always has exactly one)."""
+        return self.household[0]
+
+    @cached_property
+    def person_ages(self) -> tuple[int, ...]:
+        """Ages of all persons, aligned with `person` by index."""
+        return tuple(map(attrgetter('age'), self.person))
+
+    @cached_property
+    def head_of_household(self) -> Optional[Person]:
+        """The head of household `Person`, computed once per request."""
+        index = self.head_of_household_index
+        return self.person[index] if index is not None else None
 
     @model_validator(mode='after')
     def validate_head_of_household_rule(self):
@@ -133,8 +170,8 @@ class EligibilityRequest(BaseModel):
         if not self.person:
             return self  # Let other validators handle missing persons list
 
-        head_of_household_count = sum(
-            1 for p in self.person if p.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD
+        head_of_household_count = countOf(
+            map(attrgetter('household_member_type'), self.person), _HEAD_OF_HOUSEHOLD
         )
 
         if head_of_household_count != 1:
@@ -155,18 +192,16 @@ class EligibilityRequest(BaseModel):
             raise ValueError("household.livingRenting must be true if household.livingRentalType is specified.")
 
         # Rule 2: if household.livingPreferNotToSay is true, other living flags must be false
-        if household.living_prefer_not_to_say:
-            other_living_flags = [
-                household.living_renting,
-                household.living_owner,
-                household.living_staying_with_friend,
-                household.living_hotel,
-                household.living_shelter,
-            ]
-            if any(other_living_flags):
-                raise ValueError(
-                    "If household.livingPreferNotToSay is true, other living flags (renting, owner, etc.) must be false."
-                )
+        if household.living_prefer_not_to_say and (
+            household.living_renting
+            or household.living_owner
+            or household.living_staying_with_friend
+            or household.living_hotel
+            or household.living_shelter
+        ):
+            raise ValueError(
+                "If household.livingPreferNotToSay is true, other living flags (renting, owner, etc.) must be false."
+            )
 
         # Rule 3: No person.livingRentalOnLease can be True when household.livingRenting is false
         if not household.living_renting and any(p.living_rental_on_lease for p in self.person):
@@ -198,21 +233,48 @@ class AggregateEligibilityRequest(EligibilityRequest):
     members_pregnant_not_foster: int = Field(0, alias='membersPregnantNotFoster')
     members_plus_pregnant_minus_foster: int = Field(0, alias='membersPlusPregnantMinusFoster')
     members_plus_pregnant: int = Field(0, alias='membersPlusPregnant')
+    members_total: int = Field(0, alias='membersTotal')
     children_student_blind_disabled_eitc: int = Field(0, alias='childrenStudentBlindDisabledEITC')
     child_care_voucher_household_members: int = Field(0, alias='childCareVoucherHouseholdMembers')
     household_all_adults: bool = Field(False, alias='householdAllAdults')
+    members_youngest_age: int = Field(0, alias='membersYoungestAge')
+    members_oldest_age: int = Field(0, alias='membersOldestAge')
+    household_has_disabled_or_blind: bool = Field(False, alias='householdHasDisabledOrBlind')
+    household_has_child_3_4: bool = Field(False, alias='householdHasChild3To4')
+    household_has_student_5_21: bool = Field(False, alias='householdHasStudent5To21')
+    household_has_senior_owner: bool = Field(False, alias='householdHasSeniorOwner')
+    household_has_disabled_or_blind_owner: bool = Field(False, alias='householdHasDisabledOrBlindOwner')
+    household_has_veteran_owner: bool = Field(False, alias='householdHasVeteranOwner')
+    household_has_unemployed_55_plus: bool = Field(False, alias='householdHasUnemployed55Plus')
+    household_has_unemployed_worked_18_months: bool = Field(False, alias='householdHasUnemployedWorked18Months')
+    household_has_medicaid: bool = Field(False, alias='householdHasMedicaid')
+    household_has_medicaid_disability: bool = Field(False, alias='householdHasMedicaidDisability')
+    household_has_uninsured: bool = Field(False, alias='householdHasUninsured')
+    household_has_youth_14_24: bool = Field(False, alias='householdHasYouth14To24')
+    household_has_adult_18_64: bool = Field(False, alias='householdHasAdult18To64')
+    household_has_family_relations: bool = Field(False, alias='householdHasFamilyRelations')
+    household_has_minor_spouse_or_partner: bool = Field(False, alias='householdHasMinorSpouseOrPartner')
+    household_has_foster_parent: bool = Field(False, alias='householdHasFosterParent')
+    household_has_child_or_step_child: bool = Field(False, alias='householdHasChildOrStepChild')
+    household_has_youth_14_21: bool = Field(False, alias='householdHasYouth14To21')
+    household_has_foster_youth_14_21: bool = Field(False, alias='householdHasFosterYouth14To21')
+    household_has_disabled_or_blind_youth_14_21: bool = Field(False, alias='householdHasDisabledOrBlindYouth14To21')
+    household_has_pregnant_youth_14_21: bool = Field(False, alias='householdHasPregnantYouth14To21')
+    head_of_household_is_youth_14_21: bool = Field(False, alias='headOfHouseholdIsYouth14To21')
     
-    # Income aggregates - Person level
-    income_person_wage_self_employment_monthly: dict[int, float] = Field(default_factory=dict)
-    income_person_wage_self_employment_boarder_monthly: dict[int, float] = Field(default_factory=dict)
-    income_person_earned_yearly: dict[int, float] = Field(default_factory=dict)
-    income_person_investment_yearly: dict[int, float] = Field(default_factory=dict)
-    income_person_gifts_monthly: dict[int, float] = Field(default_factory=dict)
-    income_person_monthly: dict[int, float] = Field(default_factory=dict)
-    income_person_yearly: dict[int, float] = Field(default_factory=dict)
-    income_person_isy_monthly: dict[int, float] = Field(default_factory=dict)
-    income_person_isy_yearly: dict[int, float] = Field(default_factory=dict)
-    income_person_ses_monthly: dict[int, float] = Field(default_factory=dict)
+    # Income aggregates - Person level (aligned with `person` by index)
+    income_person_wage_self_employment_monthly: list[float] = Field(default_factory=list)
+    income_person_wage_self_employment_boarder_monthly: list[float] = Field(default_factory=list)
+    income_person_earned_yearly: list[float] = Field(default_factory=list)
+    income_person_investment_yearly: list[float] = Field(default_factory=list)
+    income_person_gifts_monthly: list[float] = Field(default_factory=list)
+    income_person_monthly: list[float] = Field(default_factory=list)
+    income_person_yearly: list[float] = Field(default_factory=list)
+    income_person_isy_monthly: list[float] = Field(default_factory=list)
+    income_person_isy_yearly: list[float] = Field(default_factory=list)
+    income_person_ses_monthly: list[float] = Field(default_factory=list)
+    # Bitmask of the income types each person has (see `INCOME_TYPE_BITS`)
+    income_person_type_mask: list[int] = Field(default_factory=list)
     
     # Income aggregates - Household level
     income_household_total_monthly: float = Field(0.0, alias='incomeHouseholdTotalMonthly')
@@ -222,6 +284,7 @@ class AggregateEligibilityRequest(EligibilityRequest):
     income_household_wage_self_employment_monthly: float = Field(0.0, alias='incomeHouseholdWageSelfEmploymentMonthly')
     income_household_unearned_monthly: float = Field(0.0, alias='incomeHouseholdUnearnedMonthly')
     income_household_boarder_monthly: float = Field(0.0, alias='incomeHouseholdBoarderMonthly')
+    income_household_investment_yearly: float = Field(0.0, alias='incomeHouseholdInvestmentYearly')
     income_household_nuclear_isy_yearly: float = Field(0.0, alias='incomeHouseholdNuclearISYYearly')
     income_household_monthly_ca: float = Field(0.0, alias='incomeHouseholdMonthlyCA')
     income_household_monthly_ca_minus_work_expense: float = Field(0.0, alias='incomeHouseholdMonthlyCAMinusWorkExpense')
@@ -231,6 +294,8 @@ class AggregateEligibilityRequest(EligibilityRequest):
     income_head_and_spouse_earned_yearly: float = Field(0.0, alias='incomeHeadAndSpouseEarnedYearly')
     income_head_and_spouse_ses_monthly: float = Field(0.0, alias='incomeHeadAndSpouseSESMonthly')
     income_owners_total_yearly: float = Field(0.0, alias='incomeOwnersTotalYearly')
+    # Bitmask of the income types any owner on the deed has (see `INCOME_TYPE_BITS`)
+    income_owners_type_mask: int = Field(0, alias='incomeOwnersTypeMask')
     income_adults_children_total_monthly: float = Field(0.0, alias='incomeAdultsChildrenTotalMonthly')
     income_child_care_voucher_total_monthly: float = Field(0.0, alias='incomeChildCareVoucherTotalMonthly')
     income_adults_total_monthly: float = Field(0.0, alias='incomeAdultsTotalMonthly')
@@ -240,6 +305,7 @@ class AggregateEligibilityRequest(EligibilityRequest):
     income_household_has_ui: bool = Field(False, alias='incomeHouseholdHasUI')
     income_household_has_benefit: bool = Field(False, alias='incomeHouseholdHasBenefit')
     income_household_has_ssi: bool = Field(False, alias='incomeHouseholdHasSSI')
+    income_head_or_spouse_has_ssi_or_ca: bool = Field(False, alias='incomeHeadOrSpouseHasSSIOrCA')
     
     # Expense aggregates - Household level
     expense_household_child_dependent_care_monthly: float = Field(0.0, alias='expenseHouseholdChildDependentCareMonthly')
@@ -258,9 +324,15 @@ class AggregateEligibilityRequest(EligibilityRequest):
         """
         Factory method to create AggregateEligibilityRequest from base EligibilityRequest.
         Computes all aggregate values from the base request data.
+
+        The base request has already been validated and the aggregates are
+        computed by our own helper, so the model is built with
+        `model_construct` instead of being dumped and re-validated.  The
+        validated `Household`/`Person` instances are shared, not copied.
         """
-        # Start with the base request data
-        data = request.model_dump()
+        # Start with the (already validated) base request fields.  Only declared
+        # fields are copied so cached properties are not carried over.
+        data = {name: getattr(request, name) for name in EligibilityRequest.model_fields}
         
         # Compute aggregates
         aggregates = cls._compute_aggregates(request)
@@ -268,7 +340,7 @@ class AggregateEligibilityRequest(EligibilityRequest):
         # Merge aggregates with base data
         data.update(aggregates)
         
-        return cls(**data)
+        return cls.model_construct(**data)
     
     @staticmethod
     def _compute_aggregates(request: EligibilityRequest) -> dict:
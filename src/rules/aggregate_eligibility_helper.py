@@ -23,33 +23,53 @@ FREQUENCY_TO_MONTHLY = {
 }
 
 # Member type groupings
-NUCLEAR_FAMILY_TYPES = [
+NUCLEAR_FAMILY_TYPES = frozenset({
     HouseholdMemberType.HEAD_OF_HOUSEHOLD,
     HouseholdMemberType.SPOUSE,
     HouseholdMemberType.CHILD,
     HouseholdMemberType.STEP_CHILD,
-]
+})
 
-CHILD_TYPES = [
+CHILD_TYPES = frozenset({
     HouseholdMemberType.CHILD,
     HouseholdMemberType.STEP_CHILD,
-]
+})
+
+# Relationships to the head of household that make it a family household
+FAMILY_RELATION_TYPES = frozenset({
+    HouseholdMemberType.SPOUSE,
+    HouseholdMemberType.CHILD,
+    HouseholdMemberType.FOSTER_CHILD,
+    HouseholdMemberType.PARENT,
+    HouseholdMemberType.GRANDPARENT,
+    HouseholdMemberType.FOSTER_PARENT,
+    HouseholdMemberType.SISTER_BROTHER,
+    HouseholdMemberType.DOMESTIC_PARTNER,
+    HouseholdMemberType.STEP_CHILD,
+    HouseholdMemberType.STEP_PARENT,
+    HouseholdMemberType.STEP_SISTER_STEP_BROTHER,
+})
+
+SPOUSE_OR_PARTNER_TYPES = frozenset({
+    HouseholdMemberType.SPOUSE,
+    HouseholdMemberType.DOMESTIC_PARTNER,
+})
 
 # Income type groupings for specific calculations
-ISY_EXCLUDED_INCOME_TYPES = [
+ISY_EXCLUDED_INCOME_TYPES = frozenset({
     IncomeType.CHILD_SUPPORT,
     IncomeType.CASH_ASSISTANCE,
     IncomeType.SS_SURVIVOR,
     IncomeType.SSI,
     IncomeType.UNEMPLOYMENT,
-]
+})
 
-EARNED_INCOME_TYPES = [
+EARNED_INCOME_TYPES = frozenset({
     IncomeType.WAGES,
     IncomeType.SELF_EMPLOYMENT,
-]
+})
 
-CASH_ASSISTANCE_INCOME_TYPES = [
+CASH_ASSISTANCE_INCOME_TYPES = frozenset({
     IncomeType.ALIMONY,
     IncomeType.BOARDER,
     IncomeType.CASH_ASSISTANCE,
@@ -68,15 +88,70 @@ CASH_ASSISTANCE_INCOME_TYPES = [
     IncomeType.VETERAN,
     IncomeType.WAGES,
     IncomeType.WORKERS_COMP,
-]
+})
 
-BENEFIT_INCOME_TYPES = [
+BENEFIT_INCOME_TYPES = frozenset({
     IncomeType.VETERAN,
     IncomeType.SSI,
     IncomeType.SS_RETIREMENT,
     IncomeType.SS_DISABILITY,
     IncomeType.SS_SURVIVOR,
-]
+})
+
+INVESTMENT_INCOME_TYPES = frozenset({
+    IncomeType.INVESTMENT,
+    IncomeType.RENTAL,
+})
+
+SES_DISCOUNTED_INCOME_TYPES = frozenset({
+    IncomeType.SS_RETIREMENT,
+    IncomeType.SS_SURVIVOR,
+})
+
+EARNED_AND_BOARDER_INCOME_TYPES = EARNED_INCOME_TYPES | {IncomeType.BOARDER}
+
+SSI_OR_CASH_ASSISTANCE_INCOME_TYPES = frozenset({
+    IncomeType.SSI,
+    IncomeType.CASH_ASSISTANCE,
+})
+
+HEAD_OR_SPOUSE_TYPES = frozenset({
+    HouseholdMemberType.HEAD_OF_HOUSEHOLD,
+    HouseholdMemberType.SPOUSE,
+})
+
+# Expense type groupings
+CHILD_DEPENDENT_CARE_EXPENSE_TYPES = frozenset({
+    ExpenseType.CHILD_CARE,
+    ExpenseType.DEPENDENT_CARE,
+})
+
+RENT_MORTGAGE_EXPENSE_TYPES = frozenset({
+    ExpenseType.RENT,
+    ExpenseType.MORTGAGE,
+})
+
+
+# Bit assigned to each income type in the per-person income type masks
+INCOME_TYPE_BITS = {
+    income_type: 1 << bit for bit, income_type in enumerate(IncomeType)
+}
+
+
+def income_type_mask(income_types) -> int:
+    """Return a mask with the bit of every type in *income_types* set."""
+    mask = 0
+    for income_type in income_types:
+        mask |= INCOME_TYPE_BITS[income_type]
+    return mask
+
+
+# Masks read by the household income flags in `_compute_household_income`
+_CASH_ASSISTANCE_BIT = INCOME_TYPE_BITS[IncomeType.CASH_ASSISTANCE]
+_UNEMPLOYMENT_BIT = INCOME_TYPE_BITS[IncomeType.UNEMPLOYMENT]
+_SSI_BIT = INCOME_TYPE_BITS[IncomeType.SSI]
+_BENEFIT_INCOME_MASK = income_type_mask(BENEFIT_INCOME_TYPES)
+_SSI_OR_CASH_ASSISTANCE_MASK = income_type_mask(SSI_OR_CASH_ASSISTANCE_INCOME_TYPES)
 
 
 def to_monthly(amount: float, frequency: Frequency) -> float:
@@ -89,215 +164,385 @@ def to_yearly(amount: float, frequency: Frequency) -> float:
 
 def _find_household_members(
     persons: List[Person],
-) -> Tuple[Optional[Person], Optional[Person]]:
-
-    head_of_household = next(
-        (
-            p
-            for p in persons
-            if p.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD
-        ),
-        None,
-    )
-    spouse = next(
-        (p for p in persons if p.household_member_type == HouseholdMemberType.SPOUSE),
-        None,
-    )
-    return head_of_household, spouse
+) -> Tuple[Optional[int], Optional[int]]:
+
+    # Indices of the (first) head of household and spouse, found in one pass
+    head_index = None
+    spouse_index = None
+    for i, p in enumerate(persons):
+        member_type = p.household_member_type
+        if member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD:
+            if head_index is None:
+                head_index = i
+        elif member_type == HouseholdMemberType.SPOUSE:
+            if spouse_index is None:
+                spouse_index = i
+    return head_index, spouse_index
 
 
 def _compute_household_composition(
-    persons: List[Person], head_of_household: Optional[Person], spouse: Optional[Person]
+    persons: List[Person], head_index: Optional[int], spouse_index: Optional[int]
 ) -> Dict[str, object]:
 
+    # Bind hot-loop lookups to locals
+    nuclear_family_types = NUCLEAR_FAMILY_TYPES
+    child_types = CHILD_TYPES
+    family_relation_types = FAMILY_RELATION_TYPES
+    spouse_or_partner_types = SPOUSE_OR_PARTNER_TYPES
+    foster_child = HouseholdMemberType.FOSTER_CHILD
+    foster_parent = HouseholdMemberType.FOSTER_PARENT
+    
     result = {}
     total_members = len(persons)
     
-    result["head_of_household_married"] = spouse is not None
+    result["head_of_household_married"] = spouse_index is not None
     
-    result["members_nuclear_only"] = sum(
-        1 for p in persons if p.household_member_type in NUCLEAR_FAMILY_TYPES
-    )
-    
-    result["foster_children"] = sum(
-        1 for p in persons if p.household_member_type == HouseholdMemberType.FOSTER_CHILD
-    )
-    
-    result["members_pregnant"] = sum(1 for p in persons if p.pregnant)
-    result["members_pregnant_not_foster"] = sum(
-        1
-        for p in persons
-        if p.pregnant and p.household_member_type != HouseholdMemberType.FOSTER_CHILD
-    )
+    # Member counts, accumulated in a single pass over persons
+    nuclear_only = 0
+    foster_children = 0
+    pregnant = 0
+    pregnant_not_foster = 0
+    eitc_children = 0
+    has_disabled_or_blind = False
+    has_child_3_4 = False
+    has_student_5_21 = False
+    has_senior_owner = False
+    has_disabled_or_blind_owner = False
+    has_veteran_owner = False
+    has_unemployed_55_plus = False
+    has_unemployed_worked_18_months = False
+    has_medicaid = False
+    has_medicaid_disability = False
+    has_uninsured = False
+    has_youth_14_24 = False
+    has_adult_18_64 = False
+    has_family_relations = False
+    has_minor_spouse_or_partner = False
+    has_foster_parent = False
+    has_child_or_step_child = False
+    has_youth_14_21 = False
+    has_foster_youth_14_21 = False
+    has_disabled_or_blind_youth_14_21 = False
+    has_pregnant_youth_14_21 = False
+    youngest_age = oldest_age = persons[0].age if persons else 0
+    for p in persons:
+        member_type = p.household_member_type
+        age = p.age
+        is_foster = member_type == foster_child
+        if member_type in nuclear_family_types:
+            nuclear_only += 1
+        if is_foster:
+            foster_children += 1
+        if p.pregnant:
+            pregnant += 1
+            if not is_foster:
+                pregnant_not_foster += 1
+        # EITC eligible children
+        if member_type in child_types:
+            if age < 19 or (age < 24 and p.student) or p.blind or p.disabled:
+                eitc_children += 1
+        if p.disabled or p.blind:
+            has_disabled_or_blind = True
+            if p.living_owner_on_deed:
+                has_disabled_or_blind_owner = True
+        if p.living_owner_on_deed:
+            if age >= 65:
+                has_senior_owner = True
+            if p.veteran:
+                has_veteran_owner = True
+        if p.unemployed:
+            if age >= 55:
+                has_unemployed_55_plus = True
+            if p.unemployed_worked_last_18_months:
+                has_unemployed_worked_18_months = True
+        if p.benefits_medicaid:
+            has_medicaid = True
+        if p.benefits_medicaid_disability:
+            has_medicaid_disability = True
+        if not p.benefits_medicaid and not p.benefits_medicaid_disability:
+            has_uninsured = True
+        if 14 <= age <= 24:
+            has_youth_14_24 = True
+        if 18 <= age <= 64:
+            has_adult_18_64 = True
+        if member_type in family_relation_types:
+            has_family_relations = True
+            if age < 18 and member_type in spouse_or_partner_types:
+                has_minor_spouse_or_partner = True
+        if member_type == foster_parent:
+            has_foster_parent = True
+        if member_type in child_types:
+            has_child_or_step_child = True
+        if 14 <= age <= 21:
+            has_youth_14_21 = True
+            if is_foster:
+                has_foster_youth_14_21 = True
+            if p.disabled or p.blind:
+                has_disabled_or_blind_youth_14_21 = True
+            if p.pregnant:
+                has_pregnant_youth_14_21 = True
+        if 3 <= age < 5:
+            has_child_3_4 = True
+        if 5 <= age <= 21 and p.student:
+            has_student_5_21 = True
+        if age < youngest_age:
+            youngest_age = age
+        elif age > oldest_age:
+            oldest_age = age
+    
+    result["members_nuclear_only"] = nuclear_only
+    result["foster_children"] = foster_children
+    result["members_pregnant"] = pregnant
+    result["members_pregnant_not_foster"] = pregnant_not_foster
     
     result["members_plus_pregnant_minus_foster"] = (
-        total_members + result["members_pregnant"] - result["foster_children"]
+        total_members + pregnant - foster_children
     )
-    result["members_plus_pregnant"] = total_members + result["members_pregnant"]
+    result["members_plus_pregnant"] = total_members + pregnant
+    result["members_total"] = total_members
     
-    # EITC eligible children
-    eitc_children = 0
-    for p in persons:
-        if p.household_member_type in CHILD_TYPES:
-            if p.age < 19 or (p.age < 24 and p.student) or p.blind or p.disabled:
-                eitc_children += 1
     result["children_student_blind_disabled_eitc"] = eitc_children
     
     result["child_care_voucher_household_members"] = (
-        total_members - result["foster_children"]
+        total_members - foster_children
     )
     
-    result["household_all_adults"] = all(p.age >= 18 for p in persons)
+    result["household_all_adults"] = youngest_age >= 18
+    result["members_youngest_age"] = youngest_age
+    result["members_oldest_age"] = oldest_age
+    result["household_has_disabled_or_blind"] = has_disabled_or_blind
+    result["household_has_child_3_4"] = has_child_3_4
+    result["household_has_student_5_21"] = has_student_5_21
+    result["household_has_senior_owner"] = has_senior_owner
+    result["household_has_disabled_or_blind_owner"] = has_disabled_or_blind_owner
+    result["household_has_veteran_owner"] = has_veteran_owner
+    result["household_has_unemployed_55_plus"] = has_unemployed_55_plus
+    result["household_has_unemployed_worked_18_months"] = has_unemployed_worked_18_months
+    result["household_has_medicaid"] = has_medicaid
+    result["household_has_medicaid_disability"] = has_medicaid_disability
+    result["household_has_uninsured"] = has_uninsured
+    result["household_has_youth_14_24"] = has_youth_14_24
+    result["household_has_adult_18_64"] = has_adult_18_64
+    result["household_has_family_relations"] = has_family_relations
+    result["household_has_minor_spouse_or_partner"] = has_minor_spouse_or_partner
+    result["household_has_foster_parent"] = has_foster_parent
+    result["household_has_child_or_step_child"] = has_child_or_step_child
+    result["household_has_youth_14_21"] = has_youth_14_21
+    result["household_has_foster_youth_14_21"] = has_foster_youth_14_21
+    result["household_has_disabled_or_blind_youth_14_21"] = has_disabled_or_blind_youth_14_21
+    result["household_has_pregnant_youth_14_21"] = has_pregnant_youth_14_21
+    result["head_of_household_is_youth_14_21"] = (
+        head_index is not None and 14 <= persons[head_index].age <= 21
+    )
     
     return result
 
 
-def _compute_person_income(persons: List[Person]) -> Dict[str, Dict[int, float]]:
+def _compute_income_monthlies(persons: List[Person]) -> List[List[float]]:
+
+    # Bind hot-loop lookups to locals
+    _to_monthly = to_monthly
+    
+    # Monthly amount of every income row, aligned with ``persons`` and with
+    # each ``person.incomes`` so downstream sums never re-convert an amount.
+    return [
+        [_to_monthly(income.amount, income.frequency) for income in person.incomes]
+        for person in persons
+    ]
+
 
+def _compute_person_income(
+    persons: List[Person], income_monthlies: List[List[float]]
+) -> Dict[str, list]:
+
+    # Bind hot-loop lookups to locals
+    earned_types = EARNED_INCOME_TYPES
+    investment_types = INVESTMENT_INCOME_TYPES
+    isy_excluded_types = ISY_EXCLUDED_INCOME_TYPES
+    ses_discounted_types = SES_DISCOUNTED_INCOME_TYPES
+    boarder = IncomeType.BOARDER
+    gifts = IncomeType.GIFTS
+    income_type_bits = INCOME_TYPE_BITS
+    
+    # Person-level values are stored as lists aligned with ``persons`` so that
+    # the value for person ``i`` is simply ``result[...][i]``.
     result = {
-        "income_person_wage_self_employment_monthly": {},
-        "income_person_wage_self_employment_boarder_monthly": {},
-        "income_person_earned_yearly": {},
-        "income_person_investment_yearly": {},
-        "income_person_gifts_monthly": {},
-        "income_person_monthly": {},
-        "income_person_yearly": {},
-        "income_person_isy_monthly": {},
-        "income_person_isy_yearly": {},
-        "income_person_ses_monthly": {},
+        "income_person_wage_self_employment_monthly": [],
+        "income_person_wage_self_employment_boarder_monthly": [],
+        "income_person_earned_yearly": [],
+        "income_person_investment_yearly": [],
+        "income_person_gifts_monthly": [],
+        "income_person_monthly": [],
+        "income_person_yearly": [],
+        "income_person_isy_monthly": [],
+        "income_person_isy_yearly": [],
+        "income_person_ses_monthly": [],
+        "income_person_type_mask": [],
     }
     
-    for i, person in enumerate(persons):
+    for person, monthlies in zip(persons, income_monthlies):
         wage_self_employment_monthly = 0.0
         boarder_monthly = 0.0
         investment_yearly = 0.0
         gifts_monthly = 0.0
         total_monthly = 0.0
+        type_mask = 0
         
-        for income in person.incomes:
-            monthly_amount = to_monthly(income.amount, income.frequency)
-            yearly_amount = to_yearly(income.amount, income.frequency)
-            
+        for income, monthly_amount in zip(person.incomes, monthlies):
             total_monthly += monthly_amount
+            type_mask |= income_type_bits[income.type]
             
-            if income.type in EARNED_INCOME_TYPES:
+            if income.type in earned_types:
                 wage_self_employment_monthly += monthly_amount
-            elif income.type == IncomeType.BOARDER:
+            elif income.type == boarder:
                 boarder_monthly += monthly_amount
-            elif income.type in [IncomeType.INVESTMENT, IncomeType.RENTAL]:
-                investment_yearly += yearly_amount
-            elif income.type == IncomeType.GIFTS:
+            elif income.type in investment_types:
+                investment_yearly += monthly_amount * 12.0
+            elif income.type == gifts:
                 gifts_monthly += monthly_amount
         
-        result["income_person_wage_self_employment_monthly"][i] = (
+        result["income_person_wage_self_employment_monthly"].append(
             wage_self_employment_monthly
         )
-        result["income_person_wage_self_employment_boarder_monthly"][i] = (
+        result["income_person_wage_self_employment_boarder_monthly"].append(
             wage_self_employment_monthly + boarder_monthly
         )
-        result["income_person_earned_yearly"][i] = wage_self_employment_monthly * 12.0
-        result["income_person_investment_yearly"][i] = investment_yearly
-        result["income_person_gifts_monthly"][i] = gifts_monthly
-        result["income_person_monthly"][i] = total_monthly
-        result["income_person_yearly"][i] = total_monthly * 12.0
+        result["income_person_earned_yearly"].append(wage_self_employment_monthly * 12.0)
+        result["income_person_investment_yearly"].append(investment_yearly)
+        result["income_person_gifts_monthly"].append(gifts_monthly)
+        result["income_person_monthly"].append(total_monthly)
+        result["income_person_yearly"].append(total_monthly * 12.0)
+        result["income_person_type_mask"].append(type_mask)
         
         # ISY income (excludes certain benefits)
         isy_monthly = sum(
-            to_monthly(inc.amount, inc.frequency)
-            for inc in person.incomes
-            if inc.type not in ISY_EXCLUDED_INCOME_TYPES
+            monthly_amount
+            for income, monthly_amount in zip(person.incomes, monthlies)
+            if income.type not in isy_excluded_types
         )
-        result["income_person_isy_monthly"][i] = isy_monthly
-        result["income_person_isy_yearly"][i] = isy_monthly * 12.0
+        result["income_person_isy_monthly"].append(isy_monthly)
+        result["income_person_isy_yearly"].append(isy_monthly * 12.0)
         
         # SES income (Social Security at 75%)
         ses_monthly = 0.0
-        for income in person.incomes:
-            monthly_amount = to_monthly(income.amount, income.frequency)
-            if income.type in [IncomeType.SS_RETIREMENT, IncomeType.SS_SURVIVOR]:
+        for income, monthly_amount in zip(person.incomes, monthlies):
+            if income.type in ses_discounted_types:
                 ses_monthly += monthly_amount * 0.75
             else:
                 ses_monthly += monthly_amount
-        result["income_person_ses_monthly"][i] = ses_monthly
+        result["income_person_ses_monthly"].append(ses_monthly)
     
     return result
 
 
 def _compute_household_income(
     persons: List[Person],
-    person_income: Dict[str, Dict[int, float]],
-    head_of_household: Optional[Person],
-    spouse: Optional[Person],
+    income_monthlies: List[List[float]],
+    person_income: Dict[str, list],
+    head_index: Optional[int],
+    spouse_index: Optional[int],
 ) -> Dict[str, object]:
 
+    # Bind hot-loop lookups to locals
+    nuclear_family_types = NUCLEAR_FAMILY_TYPES
+    child_types = CHILD_TYPES
+    foster_child = HouseholdMemberType.FOSTER_CHILD
+    earned_types = EARNED_INCOME_TYPES
+    earned_and_boarder_types = EARNED_AND_BOARDER_INCOME_TYPES
+    cash_assistance_types = CASH_ASSISTANCE_INCOME_TYPES
+    head_or_spouse_types = HEAD_OR_SPOUSE_TYPES
+    boarder = IncomeType.BOARDER
+    
     result = {}
     
     # Basic household totals
     result["income_household_total_monthly"] = sum(
-        person_income["income_person_monthly"].values()
+        person_income["income_person_monthly"]
     )
     result["income_household_total_yearly"] = (
         result["income_household_total_monthly"] * 12.0
     )
     
-    # Income less foster children
+    # Masked per-person sums, accumulated in a single pass over persons
     income_less_foster = 0.0
-    for i, person in enumerate(persons):
-        if person.household_member_type != HouseholdMemberType.FOSTER_CHILD:
-            income_less_foster += person_income["income_person_monthly"].get(i, 0.0)
-    result["income_household_total_monthly_less_foster"] = income_less_foster
-    
-    # Income less gifts
     income_less_gifts = 0.0
-    for i, person in enumerate(persons):
-        income_less_gifts += (
-            person_income["income_person_monthly"].get(i, 0.0)
-            - person_income["income_person_gifts_monthly"].get(i, 0.0)
-        )
+    nuclear_isy_yearly = 0.0
+    owners_yearly = 0.0
+    owners_type_mask = 0
+    household_type_mask = 0
+    head_or_spouse_type_mask = 0
+    adults_children_monthly = 0.0
+    # Adults total income (household minus children's wages)
+    adults_total = result["income_household_total_monthly"]
+    for person, monthly, gifts_monthly, isy_yearly, yearly, wage_self_employment_monthly, type_mask in zip(
+        persons,
+        person_income["income_person_monthly"],
+        person_income["income_person_gifts_monthly"],
+        person_income["income_person_isy_yearly"],
+        person_income["income_person_yearly"],
+        person_income["income_person_wage_self_employment_monthly"],
+        person_income["income_person_type_mask"],
+    ):
+        member_type = person.household_member_type
+        income_less_gifts += monthly - gifts_monthly
+        household_type_mask |= type_mask
+        if member_type in head_or_spouse_types:
+            head_or_spouse_type_mask |= type_mask
+        if member_type != foster_child:
+            income_less_foster += monthly
+        if member_type in nuclear_family_types:
+            nuclear_isy_yearly += isy_yearly
+            adults_children_monthly += monthly
+        if member_type in child_types:
+            adults_total -= wage_self_employment_monthly
+        if person.living_owner_on_deed:
+            owners_yearly += yearly
+            owners_type_mask |= type_mask
+    
+    result["income_household_total_monthly_less_foster"] = income_less_foster
     result["income_household_total_monthly_less_gifts"] = income_less_gifts
+    result["income_household_nuclear_isy_yearly"] = nuclear_isy_yearly
+    result["income_owners_total_yearly"] = owners_yearly
+    result["income_owners_type_mask"] = owners_type_mask
+    result["income_adults_children_total_monthly"] = adults_children_monthly
+    # Child care voucher income uses the same non-foster mask
+    result["income_child_care_voucher_total_monthly"] = income_less_foster
+    result["income_adults_total_monthly"] = adults_total
     
     result["income_household_wage_self_employment_monthly"] = sum(
-        person_income["income_person_wage_self_employment_monthly"].values()
+        person_income["income_person_wage_self_employment_monthly"]
+    )
+    result["income_household_investment_yearly"] = sum(
+        person_income["income_person_investment_yearly"]
     )
     
     # Unearned income
     unearned_monthly = 0.0
-    for person in persons:
-        for income in person.incomes:
-            if income.type not in [
-                IncomeType.WAGES,
-                IncomeType.SELF_EMPLOYMENT,
-                IncomeType.BOARDER,
-            ]:
-                unearned_monthly += to_monthly(income.amount, income.frequency)
+    for person, monthlies in zip(persons, income_monthlies):
+        for income, monthly_amount in zip(person.incomes, monthlies):
+            if income.type not in earned_and_boarder_types:
+                unearned_monthly += monthly_amount
     result["income_household_unearned_monthly"] = unearned_monthly
     
     # Boarder income
     boarder_monthly = sum(
-        to_monthly(income.amount, income.frequency)
-        for person in persons
-        for income in person.incomes
-        if income.type == IncomeType.BOARDER
+        monthly_amount
+        for person, monthlies in zip(persons, income_monthlies)
+        for income, monthly_amount in zip(person.incomes, monthlies)
+        if income.type == boarder
     )
     result["income_household_boarder_monthly"] = boarder_monthly
     
-    # Nuclear ISY income
-    nuclear_isy_yearly = 0.0
-    for i, person in enumerate(persons):
-        if person.household_member_type in NUCLEAR_FAMILY_TYPES:
-            nuclear_isy_yearly += person_income["income_person_isy_yearly"].get(i, 0.0)
-    result["income_household_nuclear_isy_yearly"] = nuclear_isy_yearly
-    
     # Cash Assistance income
     ca_monthly = 0.0
     employed_persons = 0
-    for person in persons:
+    for person, monthlies in zip(persons, income_monthlies):
         person_ca_income = 0.0
         has_employment = False
-        for income in person.incomes:
-            if income.type in CASH_ASSISTANCE_INCOME_TYPES:
-                person_ca_income += to_monthly(income.amount, income.frequency)
-            if income.type in EARNED_INCOME_TYPES:
+        for income, monthly_amount in zip(person.incomes, monthlies):
+            if income.type in cash_assistance_types:
+                person_ca_income += monthly_amount
+            if income.type in earned_types:
                 has_employment = True
         ca_monthly += person_ca_income
         if has_employment:
@@ -309,97 +554,46 @@ def _compute_household_income(
     )
     
     # Head and spouse income calculations
-    head_index = persons.index(head_of_household) if head_of_household else None
-    spouse_index = persons.index(spouse) if spouse else None
-    
     result["income_head_earned_yearly"] = (
-        person_income["income_person_earned_yearly"].get(head_index, 0.0)
+        person_income["income_person_earned_yearly"][head_index]
         if head_index is not None
         else 0.0
     )
     
     head_spouse_earned = result["income_head_earned_yearly"]
     if spouse_index is not None:
-        head_spouse_earned += person_income["income_person_earned_yearly"].get(
-            spouse_index, 0.0
-        )
+        head_spouse_earned += person_income["income_person_earned_yearly"][spouse_index]
     result["income_head_and_spouse_earned_yearly"] = head_spouse_earned
     
     head_spouse_ses = 0.0
     if head_index is not None:
-        head_spouse_ses += person_income["income_person_ses_monthly"].get(
-            head_index, 0.0
-        )
+        head_spouse_ses += person_income["income_person_ses_monthly"][head_index]
     if spouse_index is not None:
-        head_spouse_ses += person_income["income_person_ses_monthly"].get(
-            spouse_index, 0.0
-        )
+        head_spouse_ses += person_income["income_person_ses_monthly"][spouse_index]
     result["income_head_and_spouse_ses_monthly"] = head_spouse_ses
     
-    # Owners income
-    owners_yearly = 0.0
-    for i, person in enumerate(persons):
-        if person.living_owner_on_deed:
-            owners_yearly += person_income["income_person_yearly"].get(i, 0.0)
-    result["income_owners_total_yearly"] = owners_yearly
-    
-    # Adults and children income
-    adults_children_monthly = 0.0
-    for i, person in enumerate(persons):
-        if person.household_member_type in NUCLEAR_FAMILY_TYPES:
-            adults_children_monthly += person_income["income_person_monthly"].get(
-                i, 0.0
-            )
-    result["income_adults_children_total_monthly"] = adults_children_monthly
-    
-    # Child care voucher income
-    ccv_monthly = 0.0
-    for i, person in enumerate(persons):
-        if person.household_member_type != HouseholdMemberType.FOSTER_CHILD:
-            ccv_monthly += person_income["income_person_monthly"].get(i, 0.0)
-    result["income_child_care_voucher_total_monthly"] = ccv_monthly
-    
-    # Adults total income (household minus children's wages)
-    adults_total = result["income_household_total_monthly"]
-    for i, person in enumerate(persons):
-        if person.household_member_type in CHILD_TYPES:
-            adults_total -= person_income[
-                "income_person_wage_self_employment_monthly"
-            ].get(i, 0.0)
-    result["income_adults_total_monthly"] = adults_total
-    
-    # Income boolean flags
-    has_cash_assistance = any(
-        income.type == IncomeType.CASH_ASSISTANCE
-        for person in persons
-        for income in person.incomes
-    )
-    has_ui = any(
-        income.type == IncomeType.UNEMPLOYMENT
-        for person in persons
-        for income in person.incomes
-    )
-    has_benefit = any(
-        income.type in BENEFIT_INCOME_TYPES
-        for person in persons
-        for income in person.incomes
-    )
-    has_ssi = any(
-        income.type == IncomeType.SSI
-        for person in persons
-        for income in person.incomes
-    )
-    
-    result["income_household_has_cash_assistance"] = has_cash_assistance
-    result["income_household_has_ui"] = has_ui
-    result["income_household_has_benefit"] = has_benefit
-    result["income_household_has_ssi"] = has_ssi
+    # Income boolean flags, read from the type masks gathered in the masked loop
+    result["income_household_has_cash_assistance"] = bool(household_type_mask & _CASH_ASSISTANCE_BIT)
+    result["income_household_has_ui"] = bool(household_type_mask & _UNEMPLOYMENT_BIT)
+    result["income_household_has_benefit"] = bool(household_type_mask & _BENEFIT_INCOME_MASK)
+    result["income_household_has_ssi"] = bool(household_type_mask & _SSI_BIT)
+    result["income_head_or_spouse_has_ssi_or_ca"] = bool(head_or_spouse_type_mask & _SSI_OR_CASH_ASSISTANCE_MASK)
     
     return result
 
 
 def _compute_expenses(persons: List[Person]) -> Dict[str, object]:
 
+    # Bind hot-loop lookups to locals
+    child_dependent_care_types = CHILD_DEPENDENT_CARE_EXPENSE_TYPES
+    rent_mortgage_types = RENT_MORTGAGE_EXPENSE_TYPES
+    medical = ExpenseType.MEDICAL
+    rent = ExpenseType.RENT
+    child_support = ExpenseType.CHILD_SUPPORT
+    heating = ExpenseType.HEATING
+    dependent_care = ExpenseType.DEPENDENT_CARE
+    _to_monthly = to_monthly
+    
     result = {}
     
     child_dependent_care_monthly = 0.0
@@ -412,21 +606,22 @@ def _compute_expenses(persons: List[Person]) -> Dict[str, object]:
     
     for person in persons:
         for expense in person.expenses:
-            monthly_amount = to_monthly(expense.amount, expense.frequency)
+            expense_type = expense.type
+            monthly_amount = _to_monthly(expense.amount, expense.frequency)
             
-            if expense.type in [ExpenseType.CHILD_CARE, ExpenseType.DEPENDENT_CARE]:
+            if expense_type in child_dependent_care_types:
                 child_dependent_care_monthly += monthly_amount
-            if expense.type == ExpenseType.MEDICAL:
+            if expense_type == medical:
                 medical_monthly += monthly_amount
-            if expense.type in [ExpenseType.RENT, ExpenseType.MORTGAGE]:
+            if expense_type in rent_mortgage_types:
                 rent_mortgage_monthly += monthly_amount
-            if expense.type == ExpenseType.RENT:
+            if expense_type == rent:
                 rent_monthly += monthly_amount
-            if expense.type == ExpenseType.CHILD_SUPPORT:
+            if expense_type == child_support:
                 child_support_monthly += monthly_amount
-            if expense.type == ExpenseType.HEATING:
+            if expense_type == heating:
                 has_heating = True
-            if expense.type == ExpenseType.DEPENDENT_CARE:
+            if expense_type == dependent_care:
                 has_dependent_care = True
     
     result["expense_household_child_dependent_care_monthly"] = (
@@ -452,19 +647,22 @@ def compute_aggregates(request: EligibilityRequest) -> Dict[str, object]:
     result: Dict[str, object] = {}
     
     # Find key household members
-    head_of_household, spouse = _find_household_members(persons)
+    head_index, spouse_index = _find_household_members(persons)
     
     # Compute household composition
-    composition = _compute_household_composition(persons, head_of_household, spouse)
+    composition = _compute_household_composition(persons, head_index, spouse_index)
     result.update(composition)
     
+    # Convert every income row to a monthly amount once
+    income_monthlies = _compute_income_monthlies(persons)
+    
     # Compute person-level income
-    person_income = _compute_person_income(persons)
+    person_income = _compute_person_income(persons, income_monthlies)
     result.update(person_income)
     
     # Compute household-level income
     household_income = _compute_household_income(
-        persons, person_income, head_of_household, spouse
+        persons, income_monthlies, person_income, head_index, spouse_index
     )
     result.update(household_income)
     
@@ -16,7 +16,7 @@ for documentation and debugging purposes.
 """
 
 from abc import ABC, abstractmethod
-from typing import ClassVar
+from typing import Any, Callable, ClassVar
 
 from src.models.schemas import AggregateEligibilityRequest
 
@@ -31,10 +31,42 @@ class BaseRule(ABC):
     #: Optional human-readable description shown when debugging.
     description: ClassVar[str] = ""
 
+    #: Set on rules every household qualifies for so `calculate_eligibility`
+    #: can skip calling `evaluate`.
+    always_eligible: ClassVar[bool] = False
+
+    #: Set on rules no household qualifies for (ex closed programs) so
+    #: `calculate_eligibility` can skip calling `evaluate`.
+    never_eligible: ClassVar[bool] = False
+
     @classmethod
     @abstractmethod
     def evaluate(cls, request: AggregateEligibilityRequest) -> bool: 
         """Return *True* if *request* is eligible for *program*.
 
         """
-        raise NotImplementedError 
\ No newline at end of file
+        raise NotImplementedError
+
+
+class SimpleRule(BaseRule):
+    """Rule that is a single comparison of one aggregate field against a threshold.
+
+    Sub-classes describe the check as data instead of overriding `evaluate`:
+    `field` is the `AggregateEligibilityRequest` attribute to read, `op` is a
+    binary comparison from the `operator` module and `threshold` is the value
+    it is compared against, i.e. the rule holds when
+    ``op(getattr(request, field), threshold)`` is true.
+    """
+
+    #: Name of the aggregate attribute compared by this rule.
+    field: ClassVar[str]
+
+    #: Comparison applied as ``op(value, threshold)`` ex `operator.le`.
+    op: ClassVar[Callable[[Any, Any], bool]]
+
+    #: Value the aggregate attribute is compared against.
+    threshold: ClassVar[Any]
+
+    @classmethod
+    def evaluate(cls, request: AggregateEligibilityRequest) -> bool:
+        return cls.op(getattr(request, cls.field), cls.threshold)
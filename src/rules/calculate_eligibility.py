@@ -1,26 +1,178 @@
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Sequence, Tuple, Type
+
 from src.models.schemas import AggregateEligibilityRequest
+from src.rules.base_rule import BaseRule, SimpleRule
 from src.rules.registry import get_rules
 
 
+RuleEvaluator = Callable[[AggregateEligibilityRequest], bool]
+
+
+def _evaluate_rule(evaluate: RuleEvaluator, aggregate_eligibility_request: AggregateEligibilityRequest) -> bool:
+    """Call a rule's bound `evaluate`, failing closed if it raises."""
+    try:
+        return bool(evaluate(aggregate_eligibility_request))
+    except Exception as exc:  # pragma: no cover
+        # Optionally log the exception here.  For now we fail closed (i.e. not eligible)
+        # so that a broken rule does not grant benefits in error.
+        print(f"[WARN] Rule '{evaluate.__self__.__name__}' raised an exception during evaluation: {exc}")
+        return False
+
+
+@lru_cache(maxsize=1)
+def _group_simple_rules(
+    simple_rules: Tuple[Type[SimpleRule], ...],
+) -> Dict[Tuple[str, object, object], Tuple[Type[SimpleRule], ...]]:
+    """Group *simple_rules* by their (field, op, threshold) comparison.
+
+    Distinct programs can share the same eligibility test (ex S2R026 and
+    S2R045 are both `members_oldest_age >= 18`); grouping lets each distinct
+    comparison be evaluated once per request.
+    """
+    groups: Dict[Tuple[str, object, object], List[Type[SimpleRule]]] = {}
+    for rule_cls in simple_rules:
+        groups.setdefault((rule_cls.field, rule_cls.op, rule_cls.threshold), []).append(rule_cls)
+    return {comparison: tuple(group) for comparison, group in groups.items()}
+
+
+def _evaluate_simple_group(
+    comparison: Tuple[str, object, object],
+    group: Tuple[Type[SimpleRule], ...],
+    aggregate_eligibility_requests: Sequence[AggregateEligibilityRequest],
+    columns: Dict[str, List[object]],
+) -> List[bool]:
+    """Apply one (field, op, threshold) *comparison* to every request.
+
+    *columns* memoizes each aggregate field gathered across the requests so
+    groups reading the same field share it.  Fails closed for the group: if
+    the field cannot be read or compared, every rule in *group* is marked not
+    eligible for every request.
+    """
+    field, op, threshold = comparison
+    try:
+        column = columns.get(field)
+        if column is None:
+            column = columns[field] = [getattr(request, field) for request in aggregate_eligibility_requests]
+        return [bool(op(value, threshold)) for value in column]
+    except Exception as exc:
+        for rule_cls in group:
+            print(f"[WARN] Rule '{rule_cls.__name__}' raised an exception during evaluation: {exc}")
+        return [False] * len(aggregate_eligibility_requests)
+
+
+def _evaluate_simple_rules(
+    simple_rules: Tuple[Type[SimpleRule], ...],
+    aggregate_eligibility_request: AggregateEligibilityRequest,
+) -> Dict[Type[BaseRule], bool]:
+    """Evaluate all `SimpleRule`s in one pass, reading each aggregate field once.
+
+    Several simple rules compare the same aggregate (ex `members_oldest_age`),
+    so each distinct field is fetched once and shared across rules, and rules
+    with identical comparisons share a single result.  See
+    `_evaluate_simple_group` for how a failing comparison is handled.
+    """
+    requests = (aggregate_eligibility_request,)
+    columns: Dict[str, List[object]] = {}
+    eligible: Dict[Type[BaseRule], bool] = {}
+    for comparison, group in _group_simple_rules(simple_rules).items():
+        (result,) = _evaluate_simple_group(comparison, group, requests, columns)
+        eligible.update(dict.fromkeys(group, result))
+    return eligible
+
+
+@lru_cache(maxsize=1)
+def _split_rules(
+    rules: Sequence[Type[BaseRule]],
+) -> Tuple[Dict[Type[BaseRule], bool], Tuple[Type[BaseRule], ...], Tuple[Type[BaseRule], ...]]:
+    """Split *rules* into (fixed results, data-driven `SimpleRule`s, object rules).
+
+    Fixed results map the `always_eligible` and `never_eligible` rules to their
+    constant outcome; callers must copy the dict before updating it.
+    """
+    fixed_results = {
+        rule_cls: rule_cls.always_eligible
+        for rule_cls in rules
+        if rule_cls.always_eligible or rule_cls.never_eligible
+    }
+    remaining = [rule_cls for rule_cls in rules if rule_cls not in fixed_results]
+    simple_rules = tuple(rule_cls for rule_cls in remaining if issubclass(rule_cls, SimpleRule))
+    object_rules = tuple(rule_cls for rule_cls in remaining if not issubclass(rule_cls, SimpleRule))
+    return fixed_results, simple_rules, object_rules
+
+
+@lru_cache(maxsize=1)
+def _rule_evaluators(object_rules: Tuple[Type[BaseRule], ...]) -> Tuple[RuleEvaluator, ...]:
+    """Return the bound `evaluate` of each object rule, in order.
+
+    Binding once avoids the classmethod descriptor lookup on every call.
+    """
+    return tuple(rule_cls.evaluate for rule_cls in object_rules)
+
+
 def calculate_eligibility(aggregate_eligibility_request: AggregateEligibilityRequest) -> List[str]:
     """Return a list of benefit programs the *eligibility_request* qualifies for.
 
-    The function iterates through all registered rules and evaluates them
-    against the provided request.  A program is added to the result list when
-    its corresponding rule evaluates to *True*.
+    The function evaluates all registered rules against the provided request.
+    Rules marked `always_eligible` or `never_eligible` are not evaluated at
+    all, and `SimpleRule`s are single field comparisons evaluated together.
+    The remaining rules are evaluated in order through their pre-bound
+    `evaluate`.  A program is added to the result list (in registration order)
+    when its corresponding rule evaluates to *True*.
     """
 
-    eligible_programs: List[str] = []
+    rules = get_rules()
+    fixed_results, simple_rules, object_rules = _split_rules(rules)
+    evaluators = _rule_evaluators(object_rules)
 
-    for rule_cls in get_rules():
-        try:
-            if rule_cls.evaluate(aggregate_eligibility_request):
-                eligible_programs.append(rule_cls.program)
-        except Exception as exc:  # pragma: no cover
-            # Optionally log the exception here.  For now we fail closed (i.e. not eligible)
-            # so that a broken rule does not grant benefits in error.
-            print(f"[WARN] Rule '{rule_cls.__name__}' raised an exception during evaluation: {exc}")
+    eligible = dict(fixed_results)
+    eligible.update(_evaluate_simple_rules(simple_rules, aggregate_eligibility_request))
+    eligible.update(zip(
+        object_rules,
+        (_evaluate_rule(evaluate, aggregate_eligibility_request) for evaluate in evaluators),
+    ))
+
+    eligible_programs: List[str] = [
+        rule_cls.program for rule_cls in rules if eligible[rule_cls]
+    ]
 
     return eligible_programs
 
+
+def calculate_eligibility_bulk(
+    aggregate_eligibility_requests: Sequence[AggregateEligibilityRequest],
+) -> List[List[str]]:
+    """Return the eligible programs for each request, in input order.
+
+    `SimpleRule`s are evaluated column-wise: each aggregate field is gathered
+    once across all requests and every simple rule reading it is applied to
+    that column.  Object rules are evaluated per request.  A single request
+    falls back to `calculate_eligibility`.
+    """
+
+    if len(aggregate_eligibility_requests) == 1:
+        return [calculate_eligibility(aggregate_eligibility_requests[0])]
+
+    rules = get_rules()
+    fixed_results, simple_rules, object_rules = _split_rules(rules)
+    evaluators = _rule_evaluators(object_rules)
+
+    columns: Dict[str, List[object]] = {}
+    simple_results: Dict[Type[BaseRule], List[bool]] = {}
+    for comparison, group in _group_simple_rules(simple_rules).items():
+        column_results = _evaluate_simple_group(comparison, group, aggregate_eligibility_requests, columns)
+        simple_results.update(dict.fromkeys(group, column_results))
+
+    object_results = [
+        [_evaluate_rule(evaluate, request) for evaluate in evaluators]
+        for request in aggregate_eligibility_requests
+    ]
+
+    all_eligible_programs: List[List[str]] = []
+    for index, request_object_results in enumerate(object_results):
+        eligible = dict(fixed_results)
+        eligible.update((rule_cls, results[index]) for rule_cls, results in simple_results.items())
+        eligible.update(zip(object_rules, request_object_results))
+        all_eligible_programs.append([rule_cls.program for rule_cls in rules if eligible[rule_cls]])
+
+    return all_eligible_programs
@@ -21,12 +21,10 @@ class ChildDependentCareTaxCredit(BaseRule):
         2. Household has child care or dependent care expenses > 0
         3. Head of household and spouse (if present) have earned income > 0
         """
-        persons = request.person
-        
         # Check condition 1: At least one eligible person
-        has_eligible_person = any(
-            p.age < 13 or p.disabled or p.blind 
-            for p in persons
+        has_eligible_person = (
+            request.members_youngest_age < 13
+            or request.household_has_disabled_or_blind
         )
         
         if not has_eligible_person:
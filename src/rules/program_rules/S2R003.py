@@ -6,7 +6,13 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
-from src.models.enums import HouseholdMemberType, IncomeType
+from src.rules.aggregate_eligibility_helper import CHILD_TYPES
+from src.models.enums import HouseholdMemberType
+
+
+# Monthly household income thresholds indexed by household size (sizes 0-1
+# have no threshold defined in the rules; sizes above 8 use the 8-member value).
+_ISY_THRESHOLDS = (0.0, 0.0, 5624.0, 6948.0, 8271.0, 9594.0, 10918.0, 11166.0, 11414.0)
 
 
 @register_rule
@@ -25,6 +31,15 @@ class InfantsToddlers(BaseRule):
         """
         persons = request.person
         
+        # Pathway 2: HoH or spouse has SSI or Cash Assistance (pre-computed aggregate)
+        if request.income_head_or_spouse_has_ssi_or_ca and request.members_youngest_age < 3:
+            return True
+        
+        # Household size does not change across persons, so check the threshold once
+        household_size = request.members_plus_pregnant
+        income_threshold = cls._get_household_income_threshold(household_size)
+        household_income_eligible = request.income_adults_children_total_monthly <= income_threshold
+        
         # Check each person for eligibility
         for i, person in enumerate(persons):
             if person.age >= 3:
@@ -34,55 +49,18 @@ class InfantsToddlers(BaseRule):
             if person.household_member_type == HouseholdMemberType.FOSTER_CHILD:
                 return True
             
-            # Check if HoH or spouse has SSI or Cash Assistance
-            if cls._head_or_spouse_has_benefits(persons):
-                return True
-            
             # Pathway 3: Child/stepchild with household income check
-            if person.household_member_type in [HouseholdMemberType.CHILD, HouseholdMemberType.STEP_CHILD]:
-                household_size = len(persons) + request.members_pregnant
-                income_threshold = cls._get_household_income_threshold(household_size)
-                
-                if request.income_adults_children_total_monthly <= income_threshold:
+            if person.household_member_type in CHILD_TYPES:
+                if household_income_eligible:
                     return True
             
             # Pathway 4: Other children with individual income check
-            if person.household_member_type not in [HouseholdMemberType.CHILD, HouseholdMemberType.STEP_CHILD]:
-                person_monthly_income = request.income_person_monthly.get(i, 0.0)
-                if person_monthly_income <= 4301.0:
-                    return True
+            elif request.income_person_monthly[i] <= 4301.0:
+                return True
         
         return False
     
-    @classmethod
-    def _head_or_spouse_has_benefits(cls, persons) -> bool:
-        """Check if head of household or spouse has SSI or Cash Assistance"""
-        for person in persons:
-            if person.household_member_type in [HouseholdMemberType.HEAD_OF_HOUSEHOLD, HouseholdMemberType.SPOUSE]:
-                for income in person.incomes:
-                    if income.type in [IncomeType.SSI, IncomeType.CASH_ASSISTANCE]:
-                        return True
-        return False
-    
     @classmethod
     def _get_household_income_threshold(cls, household_size: int) -> float:
         """Get income threshold based on household size"""
-        thresholds = {
-            2: 5624.0,
-            3: 6948.0,
-            4: 8271.0,
-            5: 9594.0,
-            6: 10918.0,
-            7: 11166.0,
-            8: 11414.0
-        }
-        
-        # For households larger than 8, use the 8-member threshold
-        if household_size > 8:
-            return thresholds[8]
-        
-        # For single member households, no threshold defined in rules
-        if household_size < 2:
-            return 0.0
-        
-        return thresholds.get(household_size, thresholds[2])
\ No newline at end of file
+        return _ISY_THRESHOLDS[min(household_size, 8)]
@@ -23,10 +23,8 @@ class ChildTaxCredit(BaseRule):
            - Married: $400,000
            - Single: $200,000
         """
-        persons = request.person
-        
         # Check if any child under 17
-        has_eligible_child = any(p.age < 17 for p in persons)
+        has_eligible_child = request.members_youngest_age < 17
         
         if not has_eligible_child:
             return False
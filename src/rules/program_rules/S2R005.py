@@ -6,7 +6,36 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
-from src.models.enums import HouseholdMemberType, LivingRentalType, IncomeType
+from src.rules.aggregate_eligibility_helper import income_type_mask
+from src.models.enums import LivingRentalType, IncomeType
+
+
+_ELIGIBLE_RENTAL_TYPES = frozenset({
+    LivingRentalType.RENT_CONTROLLED,
+    LivingRentalType.HDFC,
+    LivingRentalType.MITCHELL_LAMA,
+    LivingRentalType.SECTION_213,
+})
+
+# Based on Drools rules, qualifying income types include:
+# wages, self-employment, pension, SS benefits, unemployment, workers comp, etc.
+# Excludes: cash assistance, SSI
+_QUALIFYING_INCOME_TYPES = frozenset({
+    IncomeType.WAGES,
+    IncomeType.SELF_EMPLOYMENT,
+    IncomeType.PENSION,
+    IncomeType.SS_RETIREMENT,
+    IncomeType.SS_DISABILITY,
+    IncomeType.SS_SURVIVOR,
+    IncomeType.UNEMPLOYMENT,
+    IncomeType.WORKERS_COMP,
+    IncomeType.VETERAN,
+    IncomeType.RENTAL,
+    IncomeType.INVESTMENT,
+    IncomeType.ALIMONY,
+    IncomeType.CHILD_SUPPORT,
+})
+_QUALIFYING_INCOME_MASK = income_type_mask(_QUALIFYING_INCOME_TYPES)
 
 
 @register_rule
@@ -23,29 +52,22 @@ class DisabilityRentIncreaseExemption(BaseRule):
         3. Head of household has qualifying income types
         4. Total yearly household income ≤ $50,000
         """
-        household = request.household[0]
-        persons = request.person
+        household = request.household_primary
         
         # Check if renting
         if not household.living_renting:
             return False
         
         # Check rental type
-        eligible_rental_types = [
-            LivingRentalType.RENT_CONTROLLED,
-            LivingRentalType.HDFC,
-            LivingRentalType.MITCHELL_LAMA,
-            LivingRentalType.SECTION_213
-        ]
+        if household.living_rental_type not in _ELIGIBLE_RENTAL_TYPES:
+            return False
         
-        if household.living_rental_type not in eligible_rental_types:
+        # Check income threshold
+        if request.income_household_total_yearly > 50000:
             return False
         
         # Find head of household
-        head_of_household = next(
-            (p for p in persons if p.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD),
-            None
-        )
+        head_of_household = request.head_of_household
         
         if not head_of_household:
             return False
@@ -55,40 +77,13 @@ class DisabilityRentIncreaseExemption(BaseRule):
             return False
         
         # Check if head has qualifying income types
-        if not cls._head_has_qualifying_income(head_of_household):
-            return False
-        
-        # Check income threshold
-        if request.income_household_total_yearly > 50000:
+        if not cls._head_has_qualifying_income(request):
             return False
         
         return True
     
     @classmethod
-    def _head_has_qualifying_income(cls, head_of_household) -> bool:
+    def _head_has_qualifying_income(cls, request) -> bool:
         """Check if head of household has S2R005 qualifying income types"""
-        # Based on Drools rules, qualifying income types include:
-        # wages, self-employment, pension, SS benefits, unemployment, workers comp, etc.
-        # Excludes: cash assistance, SSI
-        
-        qualifying_income_types = [
-            IncomeType.WAGES,
-            IncomeType.SELF_EMPLOYMENT,
-            IncomeType.PENSION,
-            IncomeType.SS_RETIREMENT,
-            IncomeType.SS_DISABILITY,
-            IncomeType.SS_SURVIVOR,
-            IncomeType.UNEMPLOYMENT,
-            IncomeType.WORKERS_COMP,
-            IncomeType.VETERAN,
-            IncomeType.RENTAL,
-            IncomeType.INVESTMENT,
-            IncomeType.ALIMONY,
-            IncomeType.CHILD_SUPPORT,
-        ]
-        
-        for income in head_of_household.incomes:
-            if income.type in qualifying_income_types:
-                return True
-        
-        return False
\ No newline at end of file
+        head_type_mask = request.income_person_type_mask[request.head_of_household_index]
+        return bool(head_type_mask & _QUALIFYING_INCOME_MASK)
\ No newline at end of file
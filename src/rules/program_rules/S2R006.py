@@ -6,9 +6,16 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
+from src.rules.aggregate_eligibility_helper import HEAD_OR_SPOUSE_TYPES
 from src.models.enums import HouseholdMemberType
 
 
+# EITC thresholds indexed by number of qualifying children (3 or more share the last value)
+_MARRIED_THRESHOLDS = (24210, 53120, 59478, 63398)
+_SINGLE_THRESHOLDS = (17640, 46560, 52918, 56838)
+_CHILDLESS_SINGLE_THRESHOLD = _SINGLE_THRESHOLDS[0]
+
+
 @register_rule
 class EarnedIncomeTaxCredit(BaseRule):
     program = "S2R006"
@@ -27,18 +34,17 @@ class EarnedIncomeTaxCredit(BaseRule):
         persons = request.person
         
         # Check investment income cap
-        total_investment_income = sum(request.income_person_investment_yearly.values())
-        if total_investment_income >= 11000:
+        if request.income_household_investment_yearly >= 11000:
             return False
         
         # Get number of qualifying children (EITC definition)
         num_qualifying_children = request.children_student_blind_disabled_eitc
         
         # Check head of household pathway
-        head = next((p for p in persons if p.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD), None)
-        if head:
-            head_index = persons.index(head)
-            head_earned_income = request.income_person_earned_yearly.get(head_index, 0.0)
+        head_index = request.head_of_household_index
+        if head_index is not None:
+            head = persons[head_index]
+            head_earned_income = request.income_person_earned_yearly[head_index]
             
             # Get combined earned income for married couples
             if request.head_of_household_married:
@@ -72,39 +78,20 @@ class EarnedIncomeTaxCredit(BaseRule):
     @classmethod
     def _get_married_threshold(cls, num_children: int) -> float:
         """Get EITC threshold for married filing jointly"""
-        if num_children == 0:
-            return 24210
-        elif num_children == 1:
-            return 53120
-        elif num_children == 2:
-            return 59478
-        else:  # 3 or more
-            return 63398
+        return _MARRIED_THRESHOLDS[min(num_children, 3)]
     
     @classmethod
     def _get_single_threshold(cls, num_children: int) -> float:
         """Get EITC threshold for single filers"""
-        if num_children == 0:
-            return 17640
-        elif num_children == 1:
-            return 46560
-        elif num_children == 2:
-            return 52918
-        else:  # 3 or more
-            return 56838
+        return _SINGLE_THRESHOLDS[min(num_children, 3)]
     
     @classmethod
     def _check_individual_eligibility(cls, request, persons) -> bool:
         """Check if any individual household member qualifies"""
-        for i, person in enumerate(persons):
-            # Skip head of household and spouse
-            if person.household_member_type in [HouseholdMemberType.HEAD_OF_HOUSEHOLD, HouseholdMemberType.SPOUSE]:
-                continue
-            
-            # Check age requirement for childless EITC
-            if 25 <= person.age <= 64:
-                person_earned_income = request.income_person_earned_yearly.get(i, 0.0)
-                if 0 < person_earned_income <= 17640:
-                    return True
-        
-        return False
\ No newline at end of file
+        # Non head/spouse members aged 25-64 with earned income within the
+        # childless EITC threshold
+        return any(
+            25 <= person.age <= 64 and 0 < earned_yearly <= _CHILDLESS_SINGLE_THRESHOLD
+            for person, earned_yearly in zip(persons, request.income_person_earned_yearly)
+            if person.household_member_type not in HEAD_OR_SPOUSE_TYPES
+        )
\ No newline at end of file
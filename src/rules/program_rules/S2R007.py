@@ -6,7 +6,18 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
-from src.models.enums import IncomeType, HouseholdMemberType
+from src.rules.aggregate_eligibility_helper import SSI_OR_CASH_ASSISTANCE_INCOME_TYPES, income_type_mask
+
+
+# Income types that make a member categorically eligible
+_SNAP_BENEFIT_MASK = income_type_mask(SSI_OR_CASH_ASSISTANCE_INCOME_TYPES)
+
+# 2024 FPL monthly amounts (approximate) indexed by household size; size 0
+# falls back to the 1-member amount.
+_BASE_FPL = (1255, 1255, 1704, 2152, 2600, 3049, 3497, 3945, 4394)
+
+# Monthly standard deduction indexed by household size (6 or more share the last value)
+_STANDARD_DEDUCTIONS = (198, 198, 198, 198, 208, 244, 279)
 
 
 @register_rule
@@ -23,19 +34,18 @@ class SupplementalNutritionAssistanceProgram(BaseRule):
         3. Income under 150% FPL with earned income
         4. Income under 130% FPL for all others
         """
-        household = request.household[0]
         persons = request.person
-        household_size = len(persons) + request.members_pregnant
+        household_size = request.members_plus_pregnant
         
         # Check categorical eligibility (all members have SSI or Cash Assistance)
         if cls._check_categorical_eligibility(request, persons):
             return True
         
         # Calculate SNAP budget
-        snap_income = cls._calculate_snap_income(request)
+        snap_income = cls._calculate_snap_income(request, household_size)
         
         # Determine which FPL threshold applies
-        fpl_multiplier = cls._determine_fpl_multiplier(request, persons)
+        fpl_multiplier = cls._determine_fpl_multiplier(request)
         
         # Get FPL limit for household size
         fpl_limit = cls._get_fpl_limit(household_size, fpl_multiplier)
@@ -46,33 +56,19 @@ class SupplementalNutritionAssistanceProgram(BaseRule):
     @classmethod
     def _check_categorical_eligibility(cls, request, persons) -> bool:
         """Check if all household members have SSI or Cash Assistance"""
-        if len(persons) == 0:
-            return False
-            
-        # Check if all persons have either SSI or Cash Assistance
-        all_have_benefits = True
-        for person in persons:
-            has_ssi = False
-            has_cash_assistance = False
-            
-            for income in person.incomes:
-                if income.type == IncomeType.SSI:
-                    has_ssi = True
-                elif income.type == IncomeType.CASH_ASSISTANCE:
-                    has_cash_assistance = True
-            
-            if not (has_ssi or has_cash_assistance):
-                all_have_benefits = False
-                break
-        
-        return all_have_benefits
+        return bool(persons) and all(
+            type_mask & _SNAP_BENEFIT_MASK
+            for type_mask in request.income_person_type_mask
+        )
     
     @classmethod
-    def _calculate_snap_income(cls, request) -> float:
+    def _calculate_snap_income(cls, request, household_size: int) -> float:
         """Calculate SNAP net income after all deductions"""
+        earned_income = (request.income_household_wage_self_employment_monthly + 
+                        request.income_household_boarder_monthly)
+        
         # Start with gross income
-        gross_income = (request.income_household_wage_self_employment_monthly + 
-                       request.income_household_boarder_monthly +
+        gross_income = (earned_income +
                        request.income_household_unearned_monthly -
                        request.expense_household_child_support_monthly)
         
@@ -80,23 +76,13 @@ class SupplementalNutritionAssistanceProgram(BaseRule):
         deductions = 0.0
         
         # 20% earned income deduction
-        earned_income = (request.income_household_wage_self_employment_monthly + 
-                        request.income_household_boarder_monthly)
         deductions += earned_income * 0.20
         
         # Standard deduction based on household size
-        household_size = len(request.person) + request.members_pregnant
-        if household_size <= 3:
-            deductions += 198
-        elif household_size == 4:
-            deductions += 208
-        elif household_size == 5:
-            deductions += 244
-        else:
-            deductions += 279
+        deductions += _STANDARD_DEDUCTIONS[min(household_size, 6)]
         
         # Homeless deduction if applicable
-        household = request.household[0]
+        household = request.household_primary
         if household.living_shelter:
             deductions += 179.66
         
@@ -108,30 +94,22 @@ class SupplementalNutritionAssistanceProgram(BaseRule):
             deductions += request.expense_household_medical_monthly - 35
         
         # Calculate adjusted income
-        adjusted_income = gross_income - deductions
-        if adjusted_income < 0:
-            adjusted_income = 0
+        adjusted_income = max(gross_income - deductions, 0.0)
         
         # Calculate excess shelter costs
         shelter_costs = request.expense_household_rent_mortgage_monthly + 992  # $992 utility allowance
-        excess_shelter = shelter_costs - (adjusted_income / 2)
-        if excess_shelter < 0:
-            excess_shelter = 0
+        excess_shelter = max(shelter_costs - adjusted_income * 0.5, 0.0)
         
         # Final SNAP net income
-        net_income = adjusted_income - excess_shelter
-        if net_income < 0:
-            net_income = 0
-        
-        return net_income
+        return max(adjusted_income - excess_shelter, 0.0)
     
     @classmethod
-    def _determine_fpl_multiplier(cls, request, persons) -> float:
+    def _determine_fpl_multiplier(cls, request) -> float:
         """Determine which FPL multiplier applies based on household circumstances"""
         # Check for 200% FPL conditions
         has_child_care_expenses = request.expense_household_has_child_or_dependent_care
-        has_elderly = any(p.age >= 60 for p in persons)
-        has_disabled_or_blind = any(p.disabled or p.blind for p in persons)
+        has_elderly = request.members_oldest_age >= 60
+        has_disabled_or_blind = request.household_has_disabled_or_blind
         
         if has_child_care_expenses or has_elderly or has_disabled_or_blind:
             return 2.0
@@ -149,22 +127,10 @@ class SupplementalNutritionAssistanceProgram(BaseRule):
     @classmethod
     def _get_fpl_limit(cls, household_size: int, multiplier: float) -> float:
         """Get the FPL limit for given household size and multiplier"""
-        # 2024 FPL monthly amounts (approximate)
-        base_fpl = {
-            1: 1255,
-            2: 1704,
-            3: 2152,
-            4: 2600,
-            5: 3049,
-            6: 3497,
-            7: 3945,
-            8: 4394
-        }
-        
         # For households larger than 8, add $449 per additional person
         if household_size > 8:
-            limit = base_fpl[8] + (household_size - 8) * 449
+            limit = _BASE_FPL[8] + (household_size - 8) * 449
         else:
-            limit = base_fpl.get(household_size, base_fpl[1])
+            limit = _BASE_FPL[household_size]
         
         return limit * multiplier
\ No newline at end of file
@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 15060, 20440, 25820, 31200, 36580, 41960, 47340, 52720)
+
+
 @register_rule
 class HeadStart(BaseRule):
     program = "S2R008"
@@ -21,27 +25,14 @@ class HeadStart(BaseRule):
         2. Household receives Cash Assistance or SSI
         3. Household has foster children
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check for child aged 3-4
-        has_eligible_child = any(2 < p.age < 5 for p in persons)
-        
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 15060,
-            2: 20440,
-            3: 25820,
-            4: 31200,
-            5: 36580,
-            6: 41960,
-            7: 47340,
-            8: 52720
-        }
+        has_eligible_child = request.household_has_child_3_4
         
         # Check income eligibility (only if eligible child present)
-        if has_eligible_child and household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
+        if has_eligible_child and 1 <= household_size <= 8:
+            if request.income_household_total_yearly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         # Check Cash Assistance or SSI
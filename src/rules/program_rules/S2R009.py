@@ -20,12 +20,5 @@ class ComprehensiveAfterSchoolSystem(BaseRule):
         1. NYC residence (assumed for all requests)
         2. At least one person aged 5-21 who is a student
         """
-        persons = request.person
-        
         # Check for student aged 5-21
-        has_eligible_student = any(
-            5 <= p.age <= 21 and p.student 
-            for p in persons
-        )
-        
-        return has_eligible_student
\ No newline at end of file
+        return request.household_has_student_5_21
\ No newline at end of file
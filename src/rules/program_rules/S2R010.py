@@ -8,6 +8,16 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Monthly income thresholds indexed by household size; size 0 falls back to
+# the 1-member amount.
+_CHILD_PREGNANT_THRESHOLDS = (
+    460.10, 460.10, 574.50, 789.00, 951.70, 1119.70, 1238.20, 1357.70, 1455.20,
+)
+_GENERAL_THRESHOLDS = (
+    398.10, 398.10, 541.50, 675.00, 813.70, 955.70, 1063.20, 1214.70, 1330.20,
+)
+
+
 @register_rule
 class CashAssistance(BaseRule):
     program = "S2R010"
@@ -20,11 +30,10 @@ class CashAssistance(BaseRule):
         1. Household size
         2. Whether any person is ≤18 or pregnant (higher thresholds)
         """
-        persons = request.person
-        household_size = len(persons) + request.members_pregnant
+        household_size = request.members_plus_pregnant
         
         # Check if any person is ≤18 or pregnant
-        has_child_or_pregnant = any(p.age <= 18 or p.pregnant for p in persons)
+        has_child_or_pregnant = request.members_youngest_age <= 18 or request.members_pregnant > 0
         
         # Get monthly income after work expense deduction
         monthly_income = request.income_household_monthly_ca_minus_work_expense
@@ -40,39 +49,17 @@ class CashAssistance(BaseRule):
     @classmethod
     def _get_child_pregnant_threshold(cls, household_size: int) -> float:
         """Get income threshold for households with children or pregnant members"""
-        thresholds = {
-            1: 460.10,
-            2: 574.50,
-            3: 789.00,
-            4: 951.70,
-            5: 1119.70,
-            6: 1238.20,
-            7: 1357.70,
-            8: 1455.20
-        }
-        
         # For households larger than 8, extrapolate
         if household_size > 8:
-            return thresholds[8] + (household_size - 8) * 119.50
+            return _CHILD_PREGNANT_THRESHOLDS[8] + (household_size - 8) * 119.50
         
-        return thresholds.get(household_size, thresholds[1])
+        return _CHILD_PREGNANT_THRESHOLDS[household_size]
     
     @classmethod
     def _get_general_threshold(cls, household_size: int) -> float:
         """Get income threshold for general households"""
-        thresholds = {
-            1: 398.10,
-            2: 541.50,
-            3: 675.00,
-            4: 813.70,
-            5: 955.70,
-            6: 1063.20,
-            7: 1214.70,
-            8: 1330.20
-        }
-        
         # For households larger than 8, extrapolate
         if household_size > 8:
-            return thresholds[8] + (household_size - 8) * 115.50
+            return _GENERAL_THRESHOLDS[8] + (household_size - 8) * 115.50
         
-        return thresholds.get(household_size, thresholds[1])
\ No newline at end of file
+        return _GENERAL_THRESHOLDS[household_size]
\ No newline at end of file
@@ -12,6 +12,7 @@ from src.rules.registry import register_rule
 class QualifiedHealthPlans(BaseRule):
     program = "S2R011"
     description = "Qualified Health Plans (NY State of Health) - Healthcare marketplace plans"
+    always_eligible = True
 
     @classmethod
     def evaluate(cls, request) -> bool:
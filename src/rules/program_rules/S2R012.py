@@ -21,7 +21,7 @@ class SchoolTaxRelief(BaseRule):
         2. Household owns their home
         3. Total yearly income of all owners <= $500,000
         """
-        household = request.household[0]
+        household = request.household_primary
         
         # Check home ownership
         if not household.living_owner:
@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 54350, 62150, 69900, 77650, 83850, 90050, 96300, 102500)
+
+
 @register_rule
 class Section8Housing(BaseRule):
     program = "S2R013"
@@ -21,34 +25,16 @@ class Section8Housing(BaseRule):
         2. Head of household is 18 or older
         3. Household income below thresholds based on household size
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
-        # Check for head of household 18+
-        from src.models.enums import HouseholdMemberType
-        has_adult_head = any(
-            p.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD and p.age >= 18
-            for p in persons
-        )
-        
-        if not has_adult_head:
+        # Check income eligibility
+        if not 1 <= household_size <= 8:
+            return False
+        if request.income_household_total_yearly > _INCOME_THRESHOLDS[household_size]:
             return False
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 54350,
-            2: 62150,
-            3: 69900,
-            4: 77650,
-            5: 83850,
-            6: 90050,
-            7: 96300,
-            8: 102500
-        }
-        
-        # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
-                return True
+        # Check for head of household 18+
+        head_of_household = request.head_of_household
+        has_adult_head = head_of_household is not None and head_of_household.age >= 18
         
-        return False
\ No newline at end of file
+        return has_adult_head
\ No newline at end of file
@@ -22,8 +22,7 @@ class SeniorCitizenHomeownersExemption(BaseRule):
         3. Total yearly income of all owners <= $58,399
         4. At least one owner is 65 or older
         """
-        household = request.household[0]
-        persons = request.person
+        household = request.household_primary
         
         # Check home ownership
         if not household.living_owner:
@@ -34,9 +33,4 @@ class SeniorCitizenHomeownersExemption(BaseRule):
             return False
         
         # Check for senior owner (65+) on deed
-        has_senior_owner = any(
-            p.living_owner_on_deed and p.age >= 65
-            for p in persons
-        )
-        
-        return has_senior_owner
\ No newline at end of file
+        return request.household_has_senior_owner
\ No newline at end of file
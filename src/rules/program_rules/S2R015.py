@@ -6,7 +6,16 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
-from src.models.enums import HouseholdMemberType, LivingRentalType
+from src.models.enums import LivingRentalType
+
+
+_ELIGIBLE_RENTAL_TYPES = frozenset({
+    LivingRentalType.RENT_CONTROLLED,
+    LivingRentalType.HDFC,
+    LivingRentalType.RENT_REGULATED_HOTEL,
+    LivingRentalType.MITCHELL_LAMA,
+    LivingRentalType.SECTION_213,
+})
 
 
 @register_rule
@@ -23,30 +32,22 @@ class SeniorCitizenRentIncreaseExemption(BaseRule):
         3. Head of household is age 62+ and on the lease
         4. Total yearly household income (excluding gifts) ≤ $50,000
         """
-        household = request.household[0]
-        persons = request.person
+        household = request.household_primary
         
         # Check if household is renting
         if not household.living_renting:
             return False
         
         # Check rental type
-        eligible_rental_types = [
-            LivingRentalType.RENT_CONTROLLED,
-            LivingRentalType.HDFC,
-            LivingRentalType.RENT_REGULATED_HOTEL,
-            LivingRentalType.MITCHELL_LAMA,
-            LivingRentalType.SECTION_213
-        ]
+        if household.living_rental_type not in _ELIGIBLE_RENTAL_TYPES:
+            return False
         
-        if household.living_rental_type not in eligible_rental_types:
+        # Check income threshold
+        if request.income_household_total_yearly - request.income_household_total_monthly_less_gifts * 12 > 50000:
             return False
         
         # Find head of household
-        head_of_household = next(
-            (p for p in persons if p.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD),
-            None
-        )
+        head_of_household = request.head_of_household
         
         if not head_of_household:
             return False
@@ -55,8 +56,4 @@ class SeniorCitizenRentIncreaseExemption(BaseRule):
         if head_of_household.age < 62 or not head_of_household.living_rental_on_lease:
             return False
         
-        # Check income threshold
-        if request.income_household_total_yearly - request.income_household_total_monthly_less_gifts * 12 > 50000:
-            return False
-        
         return True
\ No newline at end of file
@@ -20,12 +20,5 @@ class PreKForAll(BaseRule):
         1. NYC residence (assumed for all requests)
         2. At least one child aged 3 or 4
         """
-        persons = request.person
-        
         # Check for child aged 3-4
-        has_eligible_child = any(
-            3 <= p.age < 5
-            for p in persons
-        )
-        
-        return has_eligible_child
\ No newline at end of file
+        return request.household_has_child_3_4
\ No newline at end of file
@@ -6,9 +6,13 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
+from src.rules.aggregate_eligibility_helper import income_type_mask
 from src.models.enums import IncomeType
 
 
+_SSI_OR_SS_DISABILITY_MASK = income_type_mask((IncomeType.SSI, IncomeType.SS_DISABILITY))
+
+
 @register_rule
 class DisabledHomeownersExemption(BaseRule):
     program = "S2R017"
@@ -26,8 +30,7 @@ class DisabledHomeownersExemption(BaseRule):
            - Blind  
            - Receiving SSI or SS Disability benefits
         """
-        household = request.household[0]
-        persons = request.person
+        household = request.household_primary
         
         # Check home ownership
         if not household.living_owner:
@@ -38,19 +41,8 @@ class DisabledHomeownersExemption(BaseRule):
             return False
         
         # Check for disabled or blind owner on deed
-        has_disabled_or_blind_owner = any(
-            p.living_owner_on_deed and (p.disabled or p.blind)
-            for p in persons
-        )
-        
-        if has_disabled_or_blind_owner:
+        if request.household_has_disabled_or_blind_owner:
             return True
         
         # Check if any owner has SSI or SS Disability income
-        for person in persons:
-            if person.living_owner_on_deed:
-                for income in person.incomes:
-                    if income.type in [IncomeType.SSI, IncomeType.SS_DISABILITY]:
-                        return True
-        
-        return False
\ No newline at end of file
+        return bool(request.income_owners_type_mask & _SSI_OR_SS_DISABILITY_MASK)
\ No newline at end of file
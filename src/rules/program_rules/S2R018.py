@@ -21,17 +21,11 @@ class VeteransPropertyTaxExemption(BaseRule):
         2. Household owns their home
         3. At least one veteran is on the deed
         """
-        household = request.household[0]
-        persons = request.person
+        household = request.household_primary
         
         # Check home ownership
         if not household.living_owner:
             return False
         
         # Check for veteran owner on deed
-        has_veteran_owner = any(
-            p.veteran and p.living_owner_on_deed
-            for p in persons
-        )
-        
-        return has_veteran_owner
\ No newline at end of file
+        return request.household_has_veteran_owner
\ No newline at end of file
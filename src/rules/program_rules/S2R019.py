@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Monthly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 3322, 4345, 5367, 6390, 7412, 8434, 8626, 8818)
+
+
 @register_rule
 class HomeEnergyAssistanceProgram(BaseRule):
     program = "S2R019"
@@ -26,13 +30,13 @@ class HomeEnergyAssistanceProgram(BaseRule):
            - Household receives Cash Assistance, OR
            - Adults' total monthly income below thresholds based on household size
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check for vulnerable person
-        has_vulnerable_person = any(
-            p.age <= 6 or p.age >= 60 or p.disabled or p.blind
-            for p in persons
+        has_vulnerable_person = (
+            request.members_youngest_age <= 6
+            or request.members_oldest_age >= 60
+            or request.household_has_disabled_or_blind
         )
         
         if not has_vulnerable_person:
@@ -42,21 +46,9 @@ class HomeEnergyAssistanceProgram(BaseRule):
         if request.income_household_has_cash_assistance:
             return True
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 3322,
-            2: 4345,
-            3: 5367,
-            4: 6390,
-            5: 7412,
-            6: 8434,
-            7: 8626,
-            8: 8818
-        }
-        
         # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_adults_total_monthly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_adults_total_monthly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         return False
\ No newline at end of file
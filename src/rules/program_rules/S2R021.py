@@ -20,12 +20,5 @@ class NewYorkStateUnemploymentInsurance(BaseRule):
         1. At least one person who is unemployed
         2. That person worked in the last 18 months
         """
-        persons = request.person
-        
         # Check for unemployed person who worked in last 18 months
-        has_eligible_unemployed = any(
-            p.unemployed and p.unemployed_worked_last_18_months
-            for p in persons
-        )
-        
-        return has_eligible_unemployed
\ No newline at end of file
+        return request.household_has_unemployed_worked_18_months
\ No newline at end of file
@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 27861, 37814, 47767, 57720, 67673, 77626, 87579, 97532)
+
+
 @register_rule
 class WomenInfantsChildren(BaseRule):
     program = "S2R022"
@@ -21,33 +25,17 @@ class WomenInfantsChildren(BaseRule):
         2. At least one person who is pregnant or under age 5
         3. Household income below thresholds based on household size
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check for pregnant person or child under 5
-        has_eligible_person = any(
-            p.pregnant or p.age < 5
-            for p in persons
-        )
+        has_eligible_person = request.members_pregnant > 0 or request.members_youngest_age < 5
         
         if not has_eligible_person:
             return False
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 27861,
-            2: 37814,
-            3: 47767,
-            4: 57720,
-            5: 67673,
-            6: 77626,
-            7: 87579,
-            8: 97532
-        }
-        
         # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_household_total_yearly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         return False
\ No newline at end of file
@@ -22,14 +22,13 @@ class NYCHAResidentEconomicEmpowermentSustainability(BaseRule):
         2. Household is renting from NYCHA
         3. At least one person aged 18 or older
         """
-        household = request.household[0]
-        persons = request.person
+        household = request.household_primary
         
         # Check NYCHA rental
         if not (household.living_renting and household.living_rental_type == LivingRentalType.NYCHA):
             return False
         
         # Check for adult (18+)
-        has_adult = any(p.age >= 18 for p in persons)
+        has_adult = request.members_oldest_age >= 18
         
         return has_adult
\ No newline at end of file
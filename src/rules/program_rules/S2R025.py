@@ -8,6 +8,20 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Households larger than 8 add $6,725 per additional person
+_ADDITIONAL_PERSON_INCREMENT = 6725
+
+# Largest pregnancy-adjusted household size: 8 persons, all of them pregnant
+_MAX_HOUSEHOLD_SIZE = 16
+
+# Yearly income thresholds indexed by household size (1-16; index 0 unused),
+# extended past 8 members up to _MAX_HOUSEHOLD_SIZE
+_INCOME_THRESHOLDS = (0, 18825, 25550, 32275, 39000, 45725, 52450, 59175, 65900) + tuple(
+    65900 + extra * _ADDITIONAL_PERSON_INCREMENT
+    for extra in range(1, _MAX_HOUSEHOLD_SIZE - 8 + 1)
+)
+
+
 @register_rule
 class OlderAdultEmploymentProgram(BaseRule):
     program = "S2R025"
@@ -20,11 +34,10 @@ class OlderAdultEmploymentProgram(BaseRule):
         1. At least one person aged 55+ who is unemployed
         2. Total yearly household income below threshold based on household size
         """
-        persons = request.person
-        household_size = len(persons) + request.members_pregnant
+        household_size = request.members_plus_pregnant
         
         # Check if any person is 55+ and unemployed
-        has_eligible_senior = any(p.age >= 55 and p.unemployed for p in persons)
+        has_eligible_senior = request.household_has_unemployed_55_plus
         
         if not has_eligible_senior:
             return False
@@ -38,19 +51,11 @@ class OlderAdultEmploymentProgram(BaseRule):
     @classmethod
     def _get_income_threshold(cls, household_size: int) -> float:
         """Get income threshold based on household size"""
-        thresholds = {
-            1: 18825,
-            2: 25550,
-            3: 32275,
-            4: 39000,
-            5: 45725,
-            6: 52450,
-            7: 59175,
-            8: 65900
-        }
-        
-        # For households larger than 8, add $6,725 per additional person
-        if household_size > 8:
-            return thresholds[8] + (household_size - 8) * 6725
-        
-        return thresholds.get(household_size, thresholds[1])
\ No newline at end of file
+        if 1 <= household_size <= _MAX_HOUSEHOLD_SIZE:
+            return _INCOME_THRESHOLDS[household_size]
+
+        # Past the table, keep adding the per-person increment
+        if household_size > _MAX_HOUSEHOLD_SIZE:
+            return _INCOME_THRESHOLDS[8] + (household_size - 8) * _ADDITIONAL_PERSON_INCREMENT
+
+        return _INCOME_THRESHOLDS[1]
\ No newline at end of file
@@ -4,24 +4,19 @@ Workforce1 eligibility rule (S2R026)
 
 from __future__ import annotations
 
-from src.rules.base_rule import BaseRule
+import operator
+
+from src.rules.base_rule import SimpleRule
 from src.rules.registry import register_rule
 
 
 @register_rule
-class Workforce1(BaseRule):
+class Workforce1(SimpleRule):
     program = "S2R026"
     description = "Workforce1 (SBS) - Job training and employment services for adults"
 
-    @classmethod
-    def evaluate(cls, request) -> bool:
-        """
-        Eligibility requires:
-        1. At least one person aged 18 or older
-        """
-        persons = request.person
-        
-        # Check for adult (18+)
-        has_adult = any(p.age >= 18 for p in persons)
-        
-        return has_adult
\ No newline at end of file
+    # Eligibility requires:
+    # 1. At least one person aged 18 or older
+    field = "members_oldest_age"
+    op = operator.ge
+    threshold = 18
@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 19578, 26572, 33566, 40560, 47554, 54548, 61542, 68536)
+
+
 @register_rule
 class CommoditySupplementalFoodProgram(BaseRule):
     program = "S2R027"
@@ -21,30 +25,17 @@ class CommoditySupplementalFoodProgram(BaseRule):
         2. At least one person aged 60 or older
         3. Household income below thresholds based on household size
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check for senior (60+)
-        has_senior = any(p.age >= 60 for p in persons)
+        has_senior = request.members_oldest_age >= 60
         
         if not has_senior:
             return False
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 19578,
-            2: 26572,
-            3: 33566,
-            4: 40560,
-            5: 47554,
-            6: 54548,
-            7: 61542,
-            8: 68536
-        }
-        
         # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_household_total_yearly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         return False
\ No newline at end of file
@@ -6,7 +6,10 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
-from src.models.enums import HouseholdMemberType
+
+
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 15060, 20440, 25820, 31200, 36580, 41960, 47340, 52720)
 
 
 @register_rule
@@ -25,60 +28,44 @@ class LearnEarn(BaseRule):
         5. Household receives Cash Assistance or SSI
         6. Household income below thresholds based on household size
         """
-        household = request.household[0]
-        persons = request.person
-        household_size = len(persons)
-        
-        # Find youth aged 14-21
-        eligible_youth = [p for p in persons if 14 <= p.age <= 21]
+        household = request.household_primary
+        household_size = request.members_total
         
-        if not eligible_youth:
+        # Check for youth aged 14-21
+        if not request.household_has_youth_14_21:
             return False
         
+        # Household-level conditions are checked before the youth conditions
         # Check condition 1: Lives in shelter
         if household.living_shelter:
             return True
         
-        # Check condition 2: Foster care
-        for youth in eligible_youth:
-            if youth.household_member_type == HouseholdMemberType.FOSTER_CHILD:
-                return True
-            # Check if youth is head of household with foster parent
-            if (youth.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD and
-                any(p.household_member_type == HouseholdMemberType.FOSTER_PARENT for p in persons)):
-                return True
-        
-        # Check condition 3: Disabled or blind
-        if any(youth.disabled or youth.blind for youth in eligible_youth):
+        # Check condition 5: Cash Assistance or SSI
+        if request.income_household_has_cash_assistance or request.income_household_has_ssi:
             return True
         
-        # Check condition 4: Pregnant or parent
-        for youth in eligible_youth:
-            if youth.pregnant:
+        # Check condition 6: Income thresholds
+        if 1 <= household_size <= 8:
+            if request.income_household_total_yearly <= _INCOME_THRESHOLDS[household_size]:
                 return True
-            # Check if youth is a parent (has children in household)
-            if youth.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD:
-                if any(p.household_member_type in [HouseholdMemberType.CHILD, HouseholdMemberType.STEP_CHILD] for p in persons):
-                    return True
         
-        # Check condition 5: Cash Assistance or SSI
-        if request.income_household_has_cash_assistance or request.income_household_has_ssi:
+        # Youth who is head of household
+        head_is_youth = request.head_of_household_is_youth_14_21
+        
+        # Check condition 2: Foster care (foster child, or head of household with a foster parent)
+        if request.household_has_foster_youth_14_21:
+            return True
+        if head_is_youth and request.household_has_foster_parent:
             return True
         
-        # Check condition 6: Income thresholds
-        income_thresholds = {
-            1: 15060,
-            2: 20440,
-            3: 25820,
-            4: 31200,
-            5: 36580,
-            6: 41960,
-            7: 47340,
-            8: 52720
-        }
+        # Check condition 3: Disabled or blind
+        if request.household_has_disabled_or_blind_youth_14_21:
+            return True
         
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
-                return True
+        # Check condition 4: Pregnant or parent (head of household with children in household)
+        if request.household_has_pregnant_youth_14_21:
+            return True
+        if head_is_youth and request.household_has_child_or_step_child:
+            return True
         
         return False
\ No newline at end of file
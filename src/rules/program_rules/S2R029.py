@@ -8,6 +8,11 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Monthly income thresholds indexed by household size including pregnant members
+# (2-8; indices 0-1 unused)
+_INCOME_THRESHOLDS = (0, 0, 2960, 3733, 4606, 5280, 6053, 6826, 7599)
+
+
 @register_rule
 class NurseFamilyPartnership(BaseRule):
     program = "S2R029"
@@ -21,10 +26,8 @@ class NurseFamilyPartnership(BaseRule):
         2. At least one pregnant person
         3. Household monthly income below thresholds based on household size + pregnant members
         """
-        persons = request.person
-        
         # Check for pregnant person
-        has_pregnant = any(p.pregnant for p in persons)
+        has_pregnant = request.members_pregnant > 0
         
         if not has_pregnant:
             return False
@@ -32,20 +35,9 @@ class NurseFamilyPartnership(BaseRule):
         # Use the pre-computed members_plus_pregnant aggregate
         members_plus_pregnant = request.members_plus_pregnant
         
-        # Income thresholds by household size including pregnant members
-        income_thresholds = {
-            2: 2960,
-            3: 3733,
-            4: 4606,
-            5: 5280,
-            6: 6053,
-            7: 6826,
-            8: 7599
-        }
-        
         # Check income eligibility
-        if members_plus_pregnant in income_thresholds:
-            if request.income_household_total_monthly <= income_thresholds[members_plus_pregnant]:
+        if 2 <= members_plus_pregnant <= 8:
+            if request.income_household_total_monthly <= _INCOME_THRESHOLDS[members_plus_pregnant]:
                 return True
         
         return False
\ No newline at end of file
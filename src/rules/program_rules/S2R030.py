@@ -20,12 +20,5 @@ class SummerYouthEmploymentProgram(BaseRule):
         1. NYC residence (assumed for all requests)
         2. At least one person aged 14-24
         """
-        persons = request.person
-        
         # Check for youth aged 14-24
-        has_eligible_youth = any(
-            14 <= p.age <= 24
-            for p in persons
-        )
-        
-        return has_eligible_youth
\ No newline at end of file
+        return request.household_has_youth_14_24
\ No newline at end of file
@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Monthly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 2799, 3799, 4799, 5598, 6798, 7798, 8798, 9798)
+
+
 @register_rule
 class NYCCare(BaseRule):
     program = "S2R031"
@@ -21,33 +25,17 @@ class NYCCare(BaseRule):
         2. At least one person without Medicaid benefits
         3. Household monthly income below thresholds based on household size
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check for person without Medicaid
-        has_uninsured = any(
-            not p.benefits_medicaid and not p.benefits_medicaid_disability
-            for p in persons
-        )
+        has_uninsured = request.household_has_uninsured
         
         if not has_uninsured:
             return False
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 2799,
-            2: 3799,
-            3: 4799,
-            4: 5598,
-            5: 6798,
-            6: 7798,
-            7: 8798,
-            8: 9798
-        }
-        
         # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_household_total_monthly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_household_total_monthly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         return False
\ No newline at end of file
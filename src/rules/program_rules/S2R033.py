@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Monthly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 3035, 3970, 4904, 5838, 6772, 7706, 7881, 8056)
+
+
 @register_rule
 class CoolingAssistanceBenefit(BaseRule):
     program = "S2R033"
@@ -28,13 +32,13 @@ class CoolingAssistanceBenefit(BaseRule):
            - Single-person household receives SSI, OR
            - Household monthly income below thresholds based on household size
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check for vulnerable person
-        has_vulnerable_person = any(
-            p.age <= 6 or p.age >= 60 or p.disabled or p.blind
-            for p in persons
+        has_vulnerable_person = (
+            request.members_youngest_age <= 6
+            or request.members_oldest_age >= 60
+            or request.household_has_disabled_or_blind
         )
         
         if not has_vulnerable_person:
@@ -48,21 +52,9 @@ class CoolingAssistanceBenefit(BaseRule):
         if household_size == 1 and request.income_household_has_ssi:
             return True
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 3035,
-            2: 3970,
-            3: 4904,
-            4: 5838,
-            5: 6772,
-            6: 7706,
-            7: 7881,
-            8: 8056
-        }
-        
         # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_household_total_monthly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_household_total_monthly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         return False
\ No newline at end of file
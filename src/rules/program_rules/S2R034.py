@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 21837, 29638, 37439, 45240, 53041, 60842, 68643, 76444)
+
+
 @register_rule
 class FairFares(BaseRule):
     program = "S2R034"
@@ -21,33 +25,17 @@ class FairFares(BaseRule):
         2. At least one person aged 18-64
         3. Household yearly income below thresholds based on household size
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check for adult aged 18-64
-        has_eligible_adult = any(
-            18 <= p.age <= 64
-            for p in persons
-        )
+        has_eligible_adult = request.household_has_adult_18_64
         
         if not has_eligible_adult:
             return False
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 21837,
-            2: 29638,
-            3: 37439,
-            4: 45240,
-            5: 53041,
-            6: 60842,
-            7: 68643,
-            8: 76444
-        }
-        
         # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_household_total_yearly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         return False
\ No newline at end of file
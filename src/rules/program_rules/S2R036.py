@@ -9,6 +9,10 @@ from src.rules.registry import register_rule
 from src.models.enums import HouseholdMemberType
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 15060, 20440, 25820, 31200, 36580, 41960, 47340, 52720)
+
+
 @register_rule
 class TrainEarn(BaseRule):
     program = "S2R036"
@@ -25,63 +29,49 @@ class TrainEarn(BaseRule):
         5. Household receives Cash Assistance or SSI
         6. Household income below thresholds based on household size
         """
-        household = request.household[0]
+        household = request.household_primary
         persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
+        
+        # Bind hot-loop lookups to locals
+        foster_child = HouseholdMemberType.FOSTER_CHILD
+        head_of_household = HouseholdMemberType.HEAD_OF_HOUSEHOLD
+        head_is_parent_or_fostered = (
+            request.household_has_foster_parent or request.household_has_child_or_step_child
+        )
         
-        # Find eligible youth (16-24, not student, unemployed)
-        eligible_youth = [
-            p for p in persons 
-            if 16 <= p.age <= 24 and not p.student and p.unemployed
-        ]
+        # Find eligible youth (16-24, not student, unemployed) and, in the same
+        # pass, whether one of them meets conditions 2-4
+        has_eligible_youth = False
+        youth_qualifies = False
+        for p in persons:
+            if not (16 <= p.age <= 24 and not p.student and p.unemployed):
+                continue
+            has_eligible_youth = True
+            member_type = p.household_member_type
+            # Condition 2: Foster care (foster child, or head of household with foster parent)
+            # Condition 3: Disabled or blind
+            # Condition 4: Pregnant or parent (head of household with children in household)
+            if (member_type == foster_child
+                    or p.disabled or p.blind or p.pregnant
+                    or (member_type == head_of_household and head_is_parent_or_fostered)):
+                youth_qualifies = True
+                break
         
-        if not eligible_youth:
+        if not has_eligible_youth:
             return False
         
         # Check condition 1: Lives in shelter
         if household.living_shelter:
             return True
         
-        # Check condition 2: Foster care
-        for youth in eligible_youth:
-            if youth.household_member_type == HouseholdMemberType.FOSTER_CHILD:
-                return True
-            # Check if youth is head of household with foster parent
-            if (youth.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD and
-                any(p.household_member_type == HouseholdMemberType.FOSTER_PARENT for p in persons)):
-                return True
-        
-        # Check condition 3: Disabled or blind
-        if any(youth.disabled or youth.blind for youth in eligible_youth):
-            return True
-        
-        # Check condition 4: Pregnant or parent
-        for youth in eligible_youth:
-            if youth.pregnant:
-                return True
-            # Check if youth is a parent (has children in household)
-            if youth.household_member_type == HouseholdMemberType.HEAD_OF_HOUSEHOLD:
-                if any(p.household_member_type in [HouseholdMemberType.CHILD, HouseholdMemberType.STEP_CHILD] for p in persons):
-                    return True
-        
         # Check condition 5: Cash Assistance or SSI
         if request.income_household_has_cash_assistance or request.income_household_has_ssi:
             return True
         
         # Check condition 6: Income thresholds
-        income_thresholds = {
-            1: 15060,
-            2: 20440,
-            3: 25820,
-            4: 31200,
-            5: 36580,
-            6: 41960,
-            7: 47340,
-            8: 52720
-        }
-        
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_household_total_yearly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
-        return False
\ No newline at end of file
+        return youth_qualifies
\ No newline at end of file
@@ -20,14 +20,9 @@ class HomeCareServicesProgram(BaseRule):
         1. Household is in NYC
         2. At least one person has Medicaid benefits
         """
-        household = request.household[0]
-        persons = request.person
-        
         # Check condition 1: Must be in NYC
         # Since the API is for NYC benefits, we assume all requests are from NYC
         # In a real implementation, this might check a specific field
         
         # Check condition 2: At least one person has Medicaid
-        has_medicaid = any(p.benefits_medicaid for p in persons)
-        
-        return has_medicaid
\ No newline at end of file
+        return request.household_has_medicaid
\ No newline at end of file
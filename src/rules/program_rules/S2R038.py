@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 33584, 45581, 57579, 69576, 81573, 93571, 105568, 117566)
+
+
 @register_rule
 class MedicaidPregnantWomen(BaseRule):
     program = "S2R038"
@@ -21,30 +25,17 @@ class MedicaidPregnantWomen(BaseRule):
         2. At least one pregnant person
         3. Household yearly income below thresholds based on household size
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check for pregnant person
-        has_pregnant = any(p.pregnant for p in persons)
+        has_pregnant = request.members_pregnant > 0
         
         if not has_pregnant:
             return False
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 33584,
-            2: 45581,
-            3: 57579,
-            4: 69576,
-            5: 81573,
-            6: 93571,
-            7: 105568,
-            8: 117566
-        }
-        
         # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_household_total_yearly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         return False
\ No newline at end of file
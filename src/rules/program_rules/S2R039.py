@@ -6,7 +6,6 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
-from src.models.enums import HouseholdMemberType
 
 
 @register_rule
@@ -23,8 +22,7 @@ class NYCFreeTaxPrep(BaseRule):
            - Single-person household with income <= $59,000, OR
            - Multi-person household where a child/stepchild is head of household with income <= $85,000
         """
-        persons = request.person
-        household_size = len(persons)
+        household_size = request.members_total
         
         # Check single-person household
         if household_size == 1:
@@ -34,10 +32,7 @@ class NYCFreeTaxPrep(BaseRule):
         # Check multi-person household with child/stepchild as head
         if household_size > 1:
             # Find if any person is a child/stepchild relation to head of household
-            has_child_relation = any(
-                p.household_member_type in [HouseholdMemberType.CHILD, HouseholdMemberType.STEP_CHILD]
-                for p in persons
-            )
+            has_child_relation = request.household_has_child_or_step_child
             
             if has_child_relation and request.income_household_total_yearly <= 85000:
                 return True
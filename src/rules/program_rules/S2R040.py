@@ -8,6 +8,11 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Monthly income thresholds indexed by household size excluding foster children
+# (2-8; indices 0-1 unused)
+_INCOME_THRESHOLDS = (0, 0, 6156, 7604, 9053, 10501, 11949, 12221, 12493)
+
+
 @register_rule
 class ChildCareVoucher(BaseRule):
     program = "S2R040"
@@ -23,20 +28,12 @@ class ChildCareVoucher(BaseRule):
            - Blind or disabled person age 18 who is a full-time student
         2. Household income (excluding foster children) below thresholds based on eligible household size
         """
-        persons = request.person
-        
-        # Check for eligible dependent
-        has_eligible_dependent = False
-        for p in persons:
-            if p.age <= 12:
-                has_eligible_dependent = True
-                break
-            if p.age <= 17 and (p.disabled or p.blind):
-                has_eligible_dependent = True
-                break
-            if p.age == 18 and p.student_fulltime and (p.disabled or p.blind):
-                has_eligible_dependent = True
-                break
+        # Check for eligible dependent: a child 12 or under is answered by the
+        # youngest member's age; only blind/disabled members need a scan
+        has_eligible_dependent = request.members_youngest_age <= 12 or any(
+            (p.disabled or p.blind) and (p.age <= 17 or (p.age == 18 and p.student_fulltime))
+            for p in request.person
+        )
         
         if not has_eligible_dependent:
             return False
@@ -44,20 +41,9 @@ class ChildCareVoucher(BaseRule):
         # Use pre-computed child care voucher household members (excludes foster children)
         eligible_members = request.child_care_voucher_household_members
         
-        # Income thresholds by eligible household size
-        income_thresholds = {
-            2: 6156,
-            3: 7604,
-            4: 9053,
-            5: 10501,
-            6: 11949,
-            7: 12221,
-            8: 12493
-        }
-        
         # Check income eligibility using child care voucher total income (excludes foster children)
-        if eligible_members in income_thresholds:
-            if request.income_child_care_voucher_total_monthly <= income_thresholds[eligible_members]:
+        if 2 <= eligible_members <= 8:
+            if request.income_child_care_voucher_total_monthly <= _INCOME_THRESHOLDS[eligible_members]:
                 return True
         
         return False
\ No newline at end of file
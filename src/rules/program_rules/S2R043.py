@@ -9,6 +9,10 @@ from src.rules.registry import register_rule
 from src.models.enums import LivingRentalType
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 20331, 27594, 34857, 42120, 49383, 56646, 63909, 71172)
+
+
 @register_rule
 class Lifeline(BaseRule):
     program = "S2R043"
@@ -23,16 +27,11 @@ class Lifeline(BaseRule):
         3. Living in NYCHA housing
         4. Household income below thresholds based on household size
         """
-        household = request.household[0]
-        persons = request.person
-        household_size = len(persons)
+        household = request.household_primary
+        household_size = request.members_total
         
         # Check condition 1: Medicaid benefits
-        has_medicaid = any(
-            p.benefits_medicaid or p.benefits_medicaid_disability
-            for p in persons
-        )
-        if has_medicaid:
+        if request.household_has_medicaid or request.household_has_medicaid_disability:
             return True
         
         # Check condition 2: Has government benefits (Veteran, SSI, SS)
@@ -44,19 +43,8 @@ class Lifeline(BaseRule):
             return True
         
         # Check condition 4: Income thresholds
-        income_thresholds = {
-            1: 20331,
-            2: 27594,
-            3: 34857,
-            4: 42120,
-            5: 49383,
-            6: 56646,
-            7: 63909,
-            8: 71172
-        }
-        
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
+        if 1 <= household_size <= 8:
+            if request.income_household_total_yearly <= _INCOME_THRESHOLDS[household_size]:
                 return True
         
         return False
\ No newline at end of file
@@ -6,9 +6,13 @@ from __future__ import annotations
 
 from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
+from src.rules.aggregate_eligibility_helper import INCOME_TYPE_BITS
 from src.models.enums import IncomeType
 
 
+_DISABILITY_MEDICAID_BIT = INCOME_TYPE_BITS[IncomeType.DISABILITY_MEDICAID]
+
+
 @register_rule
 class NYCNYConnects(BaseRule):
     program = "S2R047"
@@ -25,21 +29,12 @@ class NYCNYConnects(BaseRule):
            - Has Medicaid disability benefits, OR
            - Has Disability Medicaid income
         """
-        persons = request.person
-        
         # Check for blind, disabled, or Medicaid disability benefits
-        has_disability = any(
-            p.blind or p.disabled or p.benefits_medicaid_disability
-            for p in persons
-        )
-        
-        if has_disability:
+        if request.household_has_disabled_or_blind or request.household_has_medicaid_disability:
             return True
         
         # Check if any person has Disability Medicaid income
-        for person in persons:
-            for income in person.incomes:
-                if income.type == IncomeType.DISABILITY_MEDICAID:
-                    return True
-        
-        return False
\ No newline at end of file
+        return any(
+            type_mask & _DISABILITY_MEDICAID_BIT
+            for type_mask in request.income_person_type_mask
+        )
\ No newline at end of file
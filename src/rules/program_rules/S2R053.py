@@ -12,6 +12,7 @@ from src.rules.registry import register_rule
 class AffordableConnectivityProgram(BaseRule):
     program = "S2R053"
     description = "Affordable Connectivity Program - Internet service discount (Program closed as of Feb 8, 2024)"
+    never_eligible = True
 
     @classmethod
     def evaluate(cls, request) -> bool:
@@ -20,7 +20,7 @@ class BigAppleConnect(BaseRule):
         Eligibility requires:
         1. Household is renting from NYCHA
         """
-        household = request.household[0]
+        household = request.household_primary
         
         # Check NYCHA rental
         if household.living_renting and household.living_rental_type == LivingRentalType.NYCHA:
@@ -8,6 +8,10 @@ from src.rules.base_rule import BaseRule
 from src.rules.registry import register_rule
 
 
+# Yearly income thresholds indexed by household size (1-8; index 0 unused)
+_INCOME_THRESHOLDS = (0, 179355, 205095, 230670, 256245, 276705, 297165, 317790, 338250)
+
+
 @register_rule
 class NYCHousingConnect(BaseRule):
     program = "S2R055"
@@ -21,35 +25,18 @@ class NYCHousingConnect(BaseRule):
         2. Household cash on hand <= $256,245
         3. Household yearly income below thresholds based on household size
         """
-        household = request.household[0]
-        persons = request.person
-        household_size = len(persons)
-        
-        # Check for adult (18+)
-        has_adult = any(p.age >= 18 for p in persons)
-        
-        if not has_adult:
-            return False
+        household = request.household_primary
+        household_size = request.members_total
         
         # Check cash on hand limit
         if household.cash_on_hand is not None and household.cash_on_hand > 256245:
             return False
         
-        # Income thresholds by household size
-        income_thresholds = {
-            1: 179355,
-            2: 205095,
-            3: 230670,
-            4: 256245,
-            5: 276705,
-            6: 297165,
-            7: 317790,
-            8: 338250
-        }
-        
         # Check income eligibility
-        if household_size in income_thresholds:
-            if request.income_household_total_yearly <= income_thresholds[household_size]:
-                return True
+        if not 1 <= household_size <= 8:
+            return False
+        if request.income_household_total_yearly > _INCOME_THRESHOLDS[household_size]:
+            return False
         
-        return False
\ No newline at end of file
+        # Check for adult (18+)
+        return request.members_oldest_age >= 18
\ No newline at end of file
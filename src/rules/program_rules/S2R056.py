@@ -12,6 +12,7 @@ from src.rules.registry import register_rule
 class CommunityFoodConnection(BaseRule):
     program = "S2R056"
     description = "Community Food Connection (CFC) (HRA) - Food assistance and community resources"
+    always_eligible = True
 
     @classmethod
     def evaluate(cls, request) -> bool:
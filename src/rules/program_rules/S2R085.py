@@ -20,9 +20,7 @@ class ThreeKForAll(BaseRule):
         1. Household is in NYC
         2. At least one person is exactly 3 years old
         """
-        persons = request.person
-        
         # Check if at least one person is exactly 3 years old
-        has_three_year_old = any(p.age == 3 for p in persons)
+        has_three_year_old = 3 in request.person_ages
         
         return has_three_year_old
\ No newline at end of file
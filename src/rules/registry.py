@@ -6,26 +6,52 @@ function can then fetch the list of rules from this module.
 
 from __future__ import annotations
 
-from typing import List, Sequence, Type
+from typing import Dict, Optional, Sequence, Tuple, Type
 
 from src.rules.base_rule import BaseRule
 
 
-# Internal list of rule *classes* (not instances) so we don't repeatedly
-# instantiate them during a single evaluation run.
-_rules: List[Type[BaseRule]] = []
+# Internal mapping of program code to rule *class* (not instances) so we don't
+# repeatedly instantiate them during a single evaluation run.  Keying on the
+# program code means a program is only ever evaluated once, even if a rule
+# module is imported (or reloaded) more than once, and lets `register_rule`
+# reject two different rules claiming the same program code.
+_rules: Dict[str, Type[BaseRule]] = {}
+
+# Snapshot returned by `get_rules`, rebuilt lazily after a registration.
+_rules_snapshot: Optional[Tuple[Type[BaseRule], ...]] = None
+
+
+def _qualified_name(rule_cls: Type[BaseRule]) -> str:
+    return f"{rule_cls.__module__}.{rule_cls.__qualname__}"
 
 
 def register_rule(rule_cls: Type[BaseRule]) -> Type[BaseRule]:
-    """Decorator or helper used by individual rule modules to register themselves."""
-    if rule_cls not in _rules:
-        _rules.append(rule_cls)
+    """Decorator or helper used by individual rule modules to register themselves.
+
+    Re-registering the same class (ex after a module reload) replaces the
+    earlier one in place; a *different* class claiming an already registered
+    program code raises `ValueError`.
+    """
+    global _rules_snapshot
+    existing = _rules.get(rule_cls.program)
+    if existing is not None and _qualified_name(existing) != _qualified_name(rule_cls):
+        raise ValueError(
+            f"Program '{rule_cls.program}' is already registered by {_qualified_name(existing)}; "
+            f"cannot register {_qualified_name(rule_cls)}."
+        )
+    _rules[rule_cls.program] = rule_cls
+    _rules_snapshot = None
     return rule_cls
 
 
 def get_rules() -> Sequence[Type[BaseRule]]:
     """Return an immutable sequence of all registered rule classes."""
-    return tuple(_rules) 
+    global _rules_snapshot
+    if _rules_snapshot is None:
+        _rules_snapshot = tuple(_rules.values())
+    return _rules_snapshot
+
 
 def get_rule_codes() -> Sequence[str]:
-    return tuple(rule.program for rule in _rules)
\ No newline at end of file
+    return tuple(_rules)
@@ -16,12 +16,12 @@ def validate_request(request: Dict) -> Tuple[bool, EligibilityRequest, Union[str
         - Union[str, List[str]]: Success message if valid, or list of error messages if invalid
     """
     try:
-        eligibility_request = EligibilityRequest(**request)
+        eligibility_request = EligibilityRequest.model_validate(request)
         return True, eligibility_request, "Validation successful"
     except ValidationError as e:
         error_messages = []
-        for error in e.errors():
-            loc = " -> ".join(str(x) for x in error["loc"])
+        for error in e.errors(include_url=False, include_context=False, include_input=False):
+            loc = " -> ".join(map(str, error["loc"]))
             msg = error["msg"]
             error_messages.append(f"{loc}: {msg}")
         return False, None, error_messages
@@ -0,0 +1,63 @@
+import json
+import operator
+
+from src.models.schemas import AggregateEligibilityRequest
+from src.rules.base_rule import SimpleRule
+from src.rules.calculate_eligibility import calculate_eligibility, calculate_eligibility_bulk
+from src.rules.registry import get_rules
+from src.validation.validate_request import validate_request
+
+
+def _aggregate_requests():
+    with open('tests/data/eligibility-program-test-payload.json', 'r') as f:
+        data = json.load(f)
+
+    # Vary ages so the simple (age threshold) rules differ across the batch
+    requests = []
+    for age in (2, 4, 12, 17, 25, 61, 70) * 3:
+        payload = json.loads(json.dumps(data))
+        for person in payload['person']:
+            person['age'] = age
+        is_valid, eligibility_request, error_messages = validate_request(payload)
+        assert is_valid, error_messages
+        requests.append(AggregateEligibilityRequest.from_eligibility_request(eligibility_request))
+    return requests
+
+
+def test_bulk_matches_single_request_evaluation():
+
+    requests = _aggregate_requests()
+
+    expected = [calculate_eligibility(request) for request in requests]
+
+    assert calculate_eligibility_bulk(requests) == expected
+    assert calculate_eligibility_bulk(requests[:3]) == expected[:3]
+    assert calculate_eligibility_bulk(requests[:1]) == expected[:1]
+
+
+# Misconfigured simple rules; deliberately not registered.
+class _NoneThresholdRule(SimpleRule):
+    program = "TEST_NONE_THRESHOLD"
+    field = "members_oldest_age"
+    op = operator.lt
+    threshold = None
+
+
+class _MissingFieldRule(SimpleRule):
+    program = "TEST_MISSING_FIELD"
+    field = "no_such_aggregate"
+    op = operator.ge
+    threshold = 0
+
+
+def test_failing_simple_rule_fails_closed(monkeypatch):
+
+    requests = _aggregate_requests()
+    expected = [calculate_eligibility(request) for request in requests]
+
+    rules = tuple(get_rules()) + (_NoneThresholdRule, _MissingFieldRule)
+    monkeypatch.setattr('src.rules.calculate_eligibility.get_rules', lambda: rules)
+
+    # Only the broken rules are dropped; every other program is unaffected
+    assert [calculate_eligibility(request) for request in requests] == expected
+    assert calculate_eligibility_bulk(requests) == expected
@@ -1,23 +1,45 @@
+from functools import lru_cache
+
+import pytest
+
 # Import rule modules to ensure they are registered
 from tests.data.sample_eligibility_rule import sample_eligibility_rule
+from src.models.schemas import AggregateEligibilityRequest
 from src.rules.registry import get_rules
 
 
-def test_all_program_rules():
+ALL_RULES = get_rules()
+
+# Dynamically include all registered programs with a default expected
+# outcome of False.  Override specific programs below when their expected
+# result differs. (This can eventually be moved to a json/yaml in the test data folder)
+EXPECTED_OUTCOMES = {rule.program: False for rule in ALL_RULES}
+# The sample household is a single 23-year-old earning $89,960/year with $1,000 cash on hand.
+EXPECTED_OUTCOMES.update({
+    "S2R011": True,  # always_eligible
+    "S2R026": True,  # someone aged 18+
+    "S2R030": True,  # someone aged 14-24
+    "S2R032": True,  # someone aged 10+
+    "S2R045": True,  # someone aged 18+
+    "S2R046": True,  # someone aged 5+
+    "S2R055": True,  # adult, income and cash on hand under the 1-person limits
+    "S2R056": True,  # always_eligible
+})
+
 
-    eligibility_request = sample_eligibility_rule()
-    all_rules = get_rules()
+@lru_cache(maxsize=1)
+def _sample_request():
+    """Validate and aggregate the sample payload once for the parametrized tests."""
+    return AggregateEligibilityRequest.from_eligibility_request(sample_eligibility_rule())
 
-    # Dynamically include all registered programs with a default expected
-    # outcome of False.  Override specific programs below when their expected
-    # result differs. (This can eventually be moved to a json/yaml in the test data folder)
-    expected_outcomes = {rule.program: False for rule in all_rules}
+
+def test_program_rules_registered():
 
     # Ensure at least one rule is registered to confirm discovery is working
-    assert len(all_rules) > 0, "No rules were found in the registry."
+    assert len(ALL_RULES) > 0, "No rules were found in the registry."
 
-    registered_programs = {rule.program for rule in all_rules}
-    expected_programs = set(expected_outcomes.keys())
+    registered_programs = frozenset(rule.program for rule in ALL_RULES)
+    expected_programs = frozenset(EXPECTED_OUTCOMES)
 
     assert registered_programs == expected_programs, (
         f"Mismatch between registered rules and expected outcomes. "
@@ -25,12 +47,15 @@ def test_all_program_rules():
         f"Not registered: {expected_programs - registered_programs}."
     )
 
-    for rule in all_rules:
-        program_code = rule.program
-        expected_result = expected_outcomes[program_code]
-        actual_result = rule.evaluate(eligibility_request)
 
-        assert actual_result == expected_result, (
-            f"Rule '{program_code}' failed for sample data. "
-            f"Expected: {expected_result}, Got: {actual_result}"
-        )
\ No newline at end of file
+@pytest.mark.parametrize("rule", ALL_RULES, ids=lambda rule: rule.program)
+def test_program_rule(rule):
+
+    program_code = rule.program
+    expected_result = EXPECTED_OUTCOMES[program_code]
+    actual_result = rule.evaluate(_sample_request())
+
+    assert actual_result == expected_result, (
+        f"Rule '{program_code}' failed for sample data. "
+        f"Expected: {expected_result}, Got: {actual_result}"
+    )
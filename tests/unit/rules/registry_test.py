@@ -0,0 +1,47 @@
+import pytest
+
+from src.rules import registry
+from src.rules.base_rule import BaseRule
+from src.rules.registry import get_rules, register_rule
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    """Register into a copy of the global registry; monkeypatch restores it afterwards."""
+    monkeypatch.setattr(registry, "_rules", dict(registry._rules))
+    monkeypatch.setattr(registry, "_rules_snapshot", None)
+
+
+def _make_rule(program: str, qualname: str):
+    """Build a fresh rule class; calls with the same *qualname* mimic a module reload."""
+    rule_cls = type(qualname, (BaseRule,), {
+        "program": program,
+        "evaluate": classmethod(lambda cls, request: False),
+    })
+    rule_cls.__qualname__ = qualname
+    return rule_cls
+
+
+def test_reregistering_same_class_replaces_in_place():
+
+    original = register_rule(_make_rule("TEST_RELOAD", "ReloadedRule"))
+    programs_before = [rule.program for rule in get_rules()]
+
+    reloaded = register_rule(_make_rule("TEST_RELOAD", "ReloadedRule"))
+
+    assert reloaded is not original
+    assert [rule.program for rule in get_rules()] == programs_before
+    assert reloaded in get_rules()
+    assert original not in get_rules()
+
+
+def test_different_class_claiming_program_raises():
+
+    first = register_rule(_make_rule("TEST_DUPLICATE", "FirstRule"))
+    rules_before = get_rules()
+
+    with pytest.raises(ValueError, match="TEST_DUPLICATE"):
+        register_rule(_make_rule("TEST_DUPLICATE", "SecondRule"))
+
+    assert get_rules() == rules_before
+    assert first in get_rules()
@@ -1,17 +1,19 @@
 import json
 from src.validation.validate_request import validate_request
 
+# Loaded once at import; validate_request does not mutate its input.
+with open('tests/data/eligibility-program-test-payload.json') as f:
+    VALID_PAYLOAD = json.load(f)
+with open('tests/data/invalid-eligibility-payload.json') as f:
+    INVALID_PAYLOAD = json.load(f)
+
 def test_valid_payload():
-    with open('tests/data/eligibility-program-test-payload.json') as f:
-        data = json.load(f)
-    is_valid, _, result = validate_request(data)
+    is_valid, _, result = validate_request(VALID_PAYLOAD)
     assert is_valid is True
     assert result == "Validation successful"
 
 def test_invalid_payload():
-    with open('tests/data/invalid-eligibility-payload.json') as f:
-        data = json.load(f)
-    is_valid, _, result = validate_request(data)
+    is_valid, _, result = validate_request(INVALID_PAYLOAD)
     assert is_valid is False
     print(result)
     assert result != "Validation successful"